@@ -1,8 +1,42 @@
 # Bridge One: Exercise One
+import itertools
+from array import array
+
+CM_PER_INCH = 2.54
+# The number of results worked out before each write into out, which bounds the memory used along the way.
+CHUNK_SIZE = 4096
+
+
 def inch_to_cm(inches):
-    return inches * 2.54
+    return inches * CM_PER_INCH
+
+
+def inches_to_cm(values, out=None):
+    # Converts many lengths at once. A list gives a list; anything else (such as an array.array) gives
+    # an array.array of doubles. NumPy arrays, recognized by their __array_ufunc__ so that NumPy is
+    # only imported when one is passed, are multiplied as a whole.
+    # With out (which may be values itself), the results are written into it CHUNK_SIZE at a time,
+    # so no container the size of the whole input is made along the way. out must then have exactly
+    # one place per value (so values must have a length); it is never grown to fit.
+    if hasattr(values, '__array_ufunc__'):
+        import numpy
+        return numpy.multiply(values, CM_PER_INCH, out=out)
+    if out is not None and len(out) != len(values):
+        raise ValueError("out has room for " + str(len(out)) + " results, but there are " + str(len(values)) + " values.")
+    converted = (value * CM_PER_INCH for value in values)
+    if out is None:
+        return list(converted) if isinstance(values, list) else array('d', converted)
+    start = 0
+    chunk = list(itertools.islice(converted, CHUNK_SIZE))
+    while chunk:
+        out[start:start + len(chunk)] = array(out.typecode, chunk) if isinstance(out, array) else chunk
+        start = start + len(chunk)
+        chunk = list(itertools.islice(converted, CHUNK_SIZE))
+    return out
 
 
-print(inch_to_cm(12))
-print(inch_to_cm(36))
-print(inch_to_cm(72))
+if __name__ == "__main__":
+    print(inch_to_cm(12))
+    print(inch_to_cm(36))
+    print(inch_to_cm(72))
+    print(inches_to_cm([12, 36, 72]))
@@ -1,9 +1,58 @@
 # Bridge One: Exercise Two
+import itertools
+import operator
+import sys
+
+# The lowest bit of each byte value, and the typecodes of the array.array types that hold integers.
+PARITY_TABLE = bytes(value & 1 for value in range(256))
+INTEGER_TYPECODES = 'bBhHiIlLqQ'
+# The number of flags worked out before each write, which bounds the memory used along the way.
+CHUNK_SIZE = 1 << 16
+
+
 def is_odd(number):
     return bool(number % 2)
 
 
-print(is_odd(0))
-print(is_odd(1))
-print(is_odd(2))
-print(is_odd(3))
+def odd_flags(numbers, out=None):
+    # Finds which of many numbers are odd at once, as is_odd decides for each, as a bytearray with a 1 for each odd number
+    # and a 0 for each even one. Floats are accepted too: like is_odd, any remainder when halved counts as odd.
+    # An array.array of integers is not read number by number: only the lowest byte of each number decides,
+    # so those bytes are picked out of the array's memory and translated CHUNK_SIZE at a time.
+    # NumPy arrays of integers, recognized by their __array_ufunc__ so that NumPy is only imported when one is passed,
+    # go through numpy.bitwise_and and give an array of 0s and 1s.
+    # With out (a bytearray, or an integer NumPy array for NumPy input), the flags are written into it
+    # a chunk at a time, so no copy the size of the whole input is made along the way. out must then have exactly
+    # one place per number (so numbers must have a length); it is never grown to fit.
+    if hasattr(numbers, '__array_ufunc__'):
+        import numpy
+        return numpy.bitwise_and(numbers, 1, out=out)
+    if out is not None and len(out) != len(numbers):
+        raise ValueError("out has room for " + str(len(out)) + " flags, but there are " + str(len(numbers)) + " numbers.")
+    if getattr(numbers, 'typecode', 'd') in INTEGER_TYPECODES:
+        size = numbers.itemsize
+        low_bytes = memoryview(numbers).cast('B')[0 if sys.byteorder == 'little' else size - 1::size]
+        if out is None:
+            out = bytearray(len(low_bytes))
+        for start in range(0, len(low_bytes), CHUNK_SIZE):
+            out[start:start + CHUNK_SIZE] = bytes(low_bytes[start:start + CHUNK_SIZE]).translate(PARITY_TABLE)
+        return out
+    flags = map(bool, map(operator.mod, numbers, itertools.repeat(2)))
+    if out is None:
+        return bytearray(flags)
+    start = 0
+    chunk = bytes(itertools.islice(flags, CHUNK_SIZE))
+    while chunk:
+        out[start:start + len(chunk)] = chunk
+        start = start + len(chunk)
+        chunk = bytes(itertools.islice(flags, CHUNK_SIZE))
+    return out
+
+
+if __name__ == "__main__":
+    print(is_odd(0))
+    print(is_odd(1))
+    print(is_odd(2))
+    print(is_odd(3))
+    print(list(odd_flags([0, 1, 2, 3])))
+    print(list(odd_flags([2.0, 3.0, 2.5])))
@@ -1,12 +1,117 @@
 # Bridge One: Exercise Three
-def remove_punctuation(string):
-    # The '\'s here tell Python that the text continues onto the next line.
-    # It is useful for keeping all the text on one screen.
-    return string.replace(".", "").replace(",", "").replace("!", "") \
-        .replace("?", "").replace(":", "").replace(";", "").replace("'", "") \
-        .replace('"', '')
+import argparse
+import codecs
+import functools
+import json
+import multiprocessing
+import os
+import time
 
+PUNCTUATION = '.,!?:;\'"'
 
-print(remove_punctuation("Here's the gist of it: your shock when you saw the body tells me " +
-                         "everything I needed to know. Aren't I right? You definitely saw the corpse beforehand; " +
-                         "the only reason you'd have to hide that fact ... is that you are the murderer yourself!"))
+
+class PunctuationStripper:
+    # Removes a set of characters in a single pass, using tables that are built once.
+    # str input goes through str.translate; bytes input goes through bytes.translate,
+    # which is faster, whenever every character to remove is ASCII (and so is one byte in UTF-8).
+    def __init__(self, characters=PUNCTUATION):
+        self.characters = characters
+        self.table = str.maketrans('', '', characters)
+        self.ascii_only = characters.isascii()
+        self.deleted_bytes = characters.encode('ascii') if self.ascii_only else None
+
+    def strip(self, text):
+        if isinstance(text, (bytes, bytearray)):
+            if self.ascii_only:
+                return text.translate(None, self.deleted_bytes)
+            return text.decode('utf-8').translate(self.table).encode('utf-8')
+        return text.translate(self.table)
+
+    def strip_stream(self, source, sink, chunk_size=1 << 16):
+        # Cleans anything with a read method into anything with a write method, one chunk at a time.
+        # Binary input is cleaned as UTF-8; a character split between two chunks is put back together first.
+        chunk = source.read(chunk_size)
+        decoder = None
+        if isinstance(chunk, (bytes, bytearray)) and not self.ascii_only:
+            decoder = codecs.getincrementaldecoder('utf-8')()
+        while chunk:
+            if decoder is not None:
+                sink.write(decoder.decode(chunk).translate(self.table).encode('utf-8'))
+            else:
+                sink.write(self.strip(chunk))
+            chunk = source.read(chunk_size)
+        if decoder is not None:
+            sink.write(decoder.decode(b'', final=True).translate(self.table).encode('utf-8'))
+
+
+DEFAULT_STRIPPER = PunctuationStripper()
+
+
+def remove_punctuation(string, stripper=DEFAULT_STRIPPER):
+    return stripper.strip(string)
+
+
+def remove_punctuation_stream(source, sink, stripper=DEFAULT_STRIPPER, chunk_size=1 << 16):
+    stripper.strip_stream(source, sink, chunk_size)
+
+
+def clean_file(path):
+    # Reads and cleans one document, as bytes so that ASCII punctuation takes the fast path.
+    with open(path, 'rb') as file:
+        text = file.read()
+    return os.path.basename(path), remove_punctuation(text), len(text)
+
+
+def clean_json_line(line, field):
+    # Cleans one field of one JSON document; lines without the field are passed along unchanged.
+    document = json.loads(line)
+    if isinstance(document.get(field), str):
+        document[field] = remove_punctuation(document[field])
+    return json.dumps(document, ensure_ascii=False).encode('utf-8') + b'\n', len(line)
+
+
+def clean_corpus(source, destination, processes=None, chunksize=64, field='text'):
+    # Cleans a corpus across a pool of processes, keeping the documents in their original order.
+    # The source is either a directory, whose files are each a document (written under the same names into
+    # the destination directory), or a JSON Lines file, whose documents have their text in the given field
+    # (written to the destination file).
+    # Returns the number of documents and bytes read, the time taken, and the documents and bytes per second.
+    start_time = time.perf_counter()
+    num_documents = 0
+    num_bytes = 0
+    with multiprocessing.Pool(processes) as pool:
+        if os.path.isdir(source):
+            os.makedirs(destination, exist_ok=True)
+            paths = sorted(entry.path for entry in os.scandir(source) if entry.is_file())
+            for name, cleaned_text, size in pool.imap(clean_file, paths, chunksize):
+                with open(os.path.join(destination, name), 'wb') as file:
+                    file.write(cleaned_text)
+                num_documents += 1
+                num_bytes += size
+        else:
+            with open(source, 'rb') as source_file, open(destination, 'wb', buffering=1 << 20) as sink:
+                lines = (line for line in source_file if line.strip())
+                for cleaned_line, size in pool.imap(functools.partial(clean_json_line, field=field), lines, chunksize):
+                    sink.write(cleaned_line)
+                    num_documents += 1
+                    num_bytes += size
+    seconds = time.perf_counter() - start_time
+    return {'documents': num_documents, 'bytes': num_bytes, 'seconds': seconds,
+            'documents_per_sec': num_documents / seconds if seconds else 0.0,
+            'bytes_per_sec': num_bytes / seconds if seconds else 0.0}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Remove punctuation from a corpus (or, without one, a sample).")
+    parser.add_argument('source', nargs='?', help="a directory of documents or a JSON Lines file")
+    parser.add_argument('destination', nargs='?', help="where to write the cleaned corpus")
+    parser.add_argument('--processes', type=int, help="the number of worker processes (one per processor by default)")
+    parser.add_argument('--field', default='text', help="the field holding the text of each JSON document")
+    arguments = parser.parse_args()
+    if arguments.source and arguments.destination:
+        print(clean_corpus(arguments.source, arguments.destination, arguments.processes, field=arguments.field))
+    else:
+        print(remove_punctuation("Here's the gist of it: your shock when you saw the body tells me " +
+                                 "everything I needed to know. Aren't I right? You definitely saw the corpse " +
+                                 "beforehand; the only reason you'd have to hide that fact ... is that you are the " +
+                                 "murderer yourself!"))
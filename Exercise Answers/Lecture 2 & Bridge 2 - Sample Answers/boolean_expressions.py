@@ -0,0 +1,203 @@
+from boolean_ops import NOT, AND, OR, NOT_BITS, AND_BITS, OR_BITS
+
+# Truth tables are cached for expressions of up to this many variables: 2 ** 20 rows, one bit each, is 128 KiB.
+MAX_TABLE_VARIABLES = 20
+
+
+class Node:
+    # One node of an expression: a variable, a constant, or NOT, AND, or OR of other nodes.
+    # Nodes are only made by an ExpressionBuilder, which never makes the same node twice,
+    # so a subexpression used in many places is one shared node and is evaluated once.
+    # The operators ~, &, and | build NOT, AND, and OR.
+    __slots__ = ('builder', 'operator', 'operands', 'name', 'number')
+
+    def __init__(self, builder, operator, operands, name, number):
+        self.builder = builder
+        self.operator = operator
+        self.operands = operands
+        self.name = name
+        self.number = number
+
+    def __invert__(self):
+        return self.builder.NOT(self)
+
+    def __and__(self, other):
+        return self.builder.AND(self, other)
+
+    def __or__(self, other):
+        return self.builder.OR(self, other)
+
+    def __repr__(self):
+        if self.operator == 'VAR':
+            return self.name
+        if self.operator == 'CONST':
+            return str(self.name)
+        return self.operator + "(" + ", ".join(map(repr, self.operands)) + ")"
+
+
+class ExpressionBuilder:
+    # Builds expressions out of hash-consed nodes: every node is kept in a dict by its operator and operands,
+    # and asking for one that already exists returns it. AND and OR list their operands in a fixed order,
+    # so that AND(a, b) and AND(b, a) are the same node; simple identities (such as NOT(NOT(a)) being a,
+    # or AND(a, False) being False) are applied as nodes are built.
+    def __init__(self):
+        self.nodes = {}
+        self.false = self.node('CONST', (), False)
+        self.true = self.node('CONST', (), True)
+
+    def node(self, operator, operands, name=None):
+        key = (operator, tuple(operand.number for operand in operands), name)
+        if key not in self.nodes:
+            self.nodes[key] = Node(self, operator, operands, name, len(self.nodes))
+        return self.nodes[key]
+
+    def variable(self, name):
+        return self.node('VAR', (), name)
+
+    def constant(self, value):
+        return self.true if value else self.false
+
+    def NOT(self, operand):
+        if operand.operator == 'NOT':
+            return operand.operands[0]
+        if operand.operator == 'CONST':
+            return self.constant(not operand.name)
+        return self.node('NOT', (operand,))
+
+    def AND(self, operand1, operand2):
+        if operand1 is self.false or operand2 is self.false:
+            return self.false
+        if operand1 is self.true or operand1 is operand2:
+            return operand2
+        if operand2 is self.true:
+            return operand1
+        return self.node('AND', tuple(sorted((operand1, operand2), key=lambda node: node.number)))
+
+    def OR(self, operand1, operand2):
+        if operand1 is self.true or operand2 is self.true:
+            return self.true
+        if operand1 is self.false or operand1 is operand2:
+            return operand2
+        if operand2 is self.false:
+            return operand1
+        return self.node('OR', tuple(sorted((operand1, operand2), key=lambda node: node.number)))
+
+    def compile(self, root, max_table_variables=MAX_TABLE_VARIABLES):
+        return CompiledExpression(root, max_table_variables)
+
+
+class CompiledExpression:
+    # An expression ready to be evaluated many times. Its variables are numbered in the order they were made,
+    # and row r of its truth table is the assignment in which variable i is True if bit i of r is set.
+    # With few enough variables, the whole truth table is worked out once, as an int with one bit per row,
+    # and evaluating any assignment is then a single lookup. Otherwise, each assignment is evaluated
+    # by walking the expression, skipping the second operand of AND and OR when the first decides the answer.
+    def __init__(self, root, max_table_variables=MAX_TABLE_VARIABLES):
+        self.root = root
+        self.max_table_variables = max_table_variables
+        variables = {}
+        stack = [root]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if node.number not in seen:
+                seen.add(node.number)
+                if node.operator == 'VAR':
+                    variables[node.number] = node.name
+                stack.extend(node.operands)
+        self.variables = [variables[number] for number in sorted(variables)]
+        self.table = None
+        self.table_bytes = None
+
+    def walk(self, leaf, NOT_operation, AND_operation, OR_operation, false, true):
+        # Evaluates every node that the answer depends on, once each, without recursing.
+        # leaf gives the value of a variable by name; false and true are the values that decide AND and OR.
+        values = {}
+        stack = [self.root]
+        while stack:
+            node = stack[-1]
+            if node.number in values:
+                stack.pop()
+            elif node.operator == 'VAR':
+                values[node.number] = leaf(node.name)
+            elif node.operator == 'CONST':
+                values[node.number] = true if node.name else false
+            elif node.operator == 'NOT':
+                operand = node.operands[0]
+                if operand.number in values:
+                    values[node.number] = NOT_operation(values[operand.number])
+                else:
+                    stack.append(operand)
+            else:
+                first, second = node.operands
+                if first.number not in values:
+                    stack.append(first)
+                    continue
+                left = values[first.number]
+                if left == (false if node.operator == 'AND' else true):
+                    values[node.number] = left
+                elif second.number not in values:
+                    stack.append(second)
+                elif node.operator == 'AND':
+                    values[node.number] = AND_operation(left, values[second.number])
+                else:
+                    values[node.number] = OR_operation(left, values[second.number])
+        return values[self.root.number]
+
+    def evaluate(self, assignment):
+        # assignment maps each variable name to a bool.
+        if len(self.variables) <= self.max_table_variables:
+            return self.lookup(self.row_index(assignment))
+        return self.walk(lambda name: bool(assignment[name]), NOT, AND, OR, False, True)
+
+    def evaluate_columns(self, columns, num_rows):
+        # Evaluates a whole table of inputs at once. columns maps each variable name to an int bitset
+        # with one bit per row (see boolean_ops); the answer is a bitset of the same form.
+        mask = (1 << num_rows) - 1
+        return self.walk(lambda name: columns[name] & mask, lambda bits: NOT_BITS(bits, num_rows),
+                         AND_BITS, OR_BITS, 0, mask)
+
+    def row_index(self, assignment):
+        index: int = 0
+        for position, name in enumerate(self.variables):
+            if assignment[name]:
+                index = index | (1 << position)
+        return index
+
+    def truth_table(self):
+        if self.table is None:
+            if len(self.variables) > self.max_table_variables:
+                raise ValueError("A truth table of " + str(len(self.variables)) + " variables is too large to cache.")
+            num_rows = 1 << len(self.variables)
+            self.table = self.evaluate_columns({name: variable_column(position, len(self.variables))
+                                                for position, name in enumerate(self.variables)}, num_rows)
+            self.table_bytes = self.table.to_bytes((num_rows + 7) // 8, 'little')
+        return self.table
+
+    def lookup(self, row):
+        # Shifting the int table would copy all of it, so the row's bit is read from a bytes copy instead.
+        if self.table is None:
+            self.truth_table()
+        return bool((self.table_bytes[row >> 3] >> (row & 7)) & 1)
+
+
+def variable_column(position, num_variables):
+    # The column of a truth table for one variable: runs of 2 ** position False rows and then as many True rows,
+    # repeated to fill all 2 ** num_variables rows. The pattern is doubled by shifting until it fills them.
+    run = 1 << position
+    column = ((1 << run) - 1) << run
+    length = 2 * run
+    while length < 1 << num_variables:
+        column = column | (column << length)
+        length = 2 * length
+    return column
+
+
+if __name__ == "__main__":
+    builder = ExpressionBuilder()
+    a, b, c = builder.variable("a"), builder.variable("b"), builder.variable("c")
+    shared = a & b
+    expression = builder.compile(shared | (~shared & c))
+    print(expression.evaluate({"a": True, "b": True, "c": False}))  # should return True
+    print(expression.evaluate({"a": True, "b": False, "c": False}))  # should return False
+    print(format(expression.truth_table(), "08b"))  # should return 11111000
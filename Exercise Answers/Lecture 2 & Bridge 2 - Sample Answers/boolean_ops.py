@@ -22,18 +22,134 @@ def OR(bool1, bool2):
     return return_value
 
 
-# not operator:
-print(NOT(True)) # should return False
-print(NOT(False)) # should return True
-
-# and operator:
-print(AND(True, True)) # should return True
-print(AND(True, False)) # should return False
-print(AND(False, True)) # should return False
-print(AND(False, False)) # should return False
-
-# or operator:
-print(OR(True, True)) # should return True
-print(OR(True, False)) # should return True
-print(OR(False, True)) # should return True
-print(OR(False, False)) # should return False
+# Packed bitsets hold one boolean per bit, lane i being bit i: an int (lowest bit first), a bytes-like object
+# (lanes 0 to 7 in the first byte, lowest bit first, as int.from_bytes(..., 'little') reads it),
+# or a NumPy array of any unsigned integer type, such as numpy.packbits(..., bitorder='little') gives.
+# NumPy arrays are recognized by their __array_ufunc__, so NumPy is only imported when one is passed.
+# The bulk versions of NOT, AND, and OR work on every lane at once; for bytes-like and NumPy bitsets,
+# out may be given to write the result into an existing buffer of the same size (which may be an input).
+# Bytes-like bitsets are worked through CHUNK_SIZE bytes at a time, so no full-size copy is ever made.
+INVERTED_BYTES = bytes(255 - value for value in range(256))
+BITS_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+DIGITS_TO_BITS = bytes.maketrans(b'01', b'\x00\x01')
+CHUNK_SIZE = 1 << 16
+
+
+def NOT_BITS(bits, width=None, out=None):
+    # An int has no fixed number of lanes, so its width must be given.
+    if isinstance(bits, int):
+        if width is None:
+            raise ValueError("The width of an int bitset must be given.")
+        return ~bits & ((1 << width) - 1)
+    if hasattr(bits, '__array_ufunc__'):
+        import numpy
+        return numpy.bitwise_not(bits, out=out)
+    view = memoryview(bits).cast('B')
+    out, target = output_bits(len(view), out)
+    for start in range(0, len(view), CHUNK_SIZE):
+        chunk = bytes(view[start:start + CHUNK_SIZE])
+        target[start:start + len(chunk)] = chunk.translate(INVERTED_BYTES)
+    return out
+
+
+def AND_BITS(bits1, bits2, out=None):
+    if isinstance(bits1, int):
+        return bits1 & bits2
+    if hasattr(bits1, '__array_ufunc__'):
+        import numpy
+        return numpy.bitwise_and(bits1, bits2, out=out)
+    return combine_bits(int.__and__, bits1, bits2, out)
+
+
+def OR_BITS(bits1, bits2, out=None):
+    if isinstance(bits1, int):
+        return bits1 | bits2
+    if hasattr(bits1, '__array_ufunc__'):
+        import numpy
+        return numpy.bitwise_or(bits1, bits2, out=out)
+    return combine_bits(int.__or__, bits1, bits2, out)
+
+
+def combine_bits(operation, bits1, bits2, out):
+    # Read as ints, each chunk of the bitsets is combined a machine word at a time.
+    view1, view2 = memoryview(bits1).cast('B'), memoryview(bits2).cast('B')
+    check_widths(view1, view2)
+    out, target = output_bits(len(view1), out)
+    for start in range(0, len(view1), CHUNK_SIZE):
+        size = min(CHUNK_SIZE, len(view1) - start)
+        result = operation(int.from_bytes(view1[start:start + size], 'little'),
+                           int.from_bytes(view2[start:start + size], 'little'))
+        target[start:start + size] = result.to_bytes(size, 'little')
+    return out
+
+
+def check_widths(bits1, bits2):
+    if len(bits1) != len(bits2):
+        raise ValueError("Bitsets of " + str(len(bits1)) + " and " + str(len(bits2)) + " bytes cannot be combined.")
+
+
+def output_bits(size, out):
+    # The buffer to write a result of size bytes into, and a byte view of it. A given out must be exactly that size.
+    if out is None:
+        out = bytearray(size)
+    target = memoryview(out).cast('B')
+    if len(target) != size:
+        raise ValueError("The result is " + str(size) + " bytes, but out is " + str(len(target)) + " bytes.")
+    return out, target
+
+
+def count_true(bits):
+    # The number of lanes that are True (the popcount). NumPy arrays are read through their buffer, as bytes.
+    if isinstance(bits, int):
+        return bits.bit_count()
+    return int.from_bytes(memoryview(bits).cast('B'), 'little').bit_count()
+
+
+def any_true(bits):
+    if isinstance(bits, int):
+        return bits != 0
+    return any(memoryview(bits).cast('B'))
+
+
+def all_true(bits, width=None):
+    # Whether the first width lanes are all True; by default, every lane of a bytes-like or NumPy bitset.
+    if isinstance(bits, int):
+        if width is None:
+            raise ValueError("The width of an int bitset must be given.")
+    else:
+        if width is None:
+            width = 8 * memoryview(bits).nbytes
+        bits = int.from_bytes(memoryview(bits).cast('B'), 'little')
+    mask = (1 << width) - 1
+    return bits & mask == mask
+
+
+def pack_bools(values):
+    # Packs booleans (or 0s and 1s) into an int bitset, the first value being the lowest bit.
+    # They are written out as binary digits, most significant first, and read back in one go by int().
+    digits = bytes(map(bool, values))[::-1].translate(BITS_TO_DIGITS)
+    return int(digits, 2) if digits else 0
+
+
+def unpack_bools(bits, width):
+    # The first width lanes of an int bitset, as a list of bools.
+    digits = format(bits & ((1 << width) - 1), 'b').zfill(width)[::-1] if width else ''
+    return list(map(bool, digits.encode('ascii').translate(DIGITS_TO_BITS)))
+
+
+if __name__ == "__main__":
+    # not operator:
+    print(NOT(True)) # should return False
+    print(NOT(False)) # should return True
+
+    # and operator:
+    print(AND(True, True)) # should return True
+    print(AND(True, False)) # should return False
+    print(AND(False, True)) # should return False
+    print(AND(False, False)) # should return False
+
+    # or operator:
+    print(OR(True, True)) # should return True
+    print(OR(True, False)) # should return True
+    print(OR(False, True)) # should return True
+    print(OR(False, False)) # should return False
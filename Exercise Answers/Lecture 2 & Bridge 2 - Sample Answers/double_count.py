@@ -1,15 +1,191 @@
+import collections
+import mmap
+import os
+
+
 def count_both_ways(snippet, phrase):
-    phrase = phrase + '|' + phrase[::-1]
-    double_count = 0
-    while snippet in phrase:
-        if phrase.startswith(snippet):
-            double_count = double_count + 1
-        phrase = phrase.lstrip(phrase[0])
-    return double_count
-
-
-print(count_both_ways('ab', 'when i am able, i will go back inside.'))  # should return 2
-print(count_both_ways('aw', 'if a swatch of the paint was watery,  what does that say about the product?'))  # should return 3
-print(count_both_ways('b', "there's nothing to be afraid of but me."))  # should return 4
-print(count_both_ways('xy', 'are you ready?'))  # should return 0
-print(count_both_ways('ti', 'this is it!'))  # should return 1
+    counter = BothWaysCounter(snippet)
+    counter.feed(phrase)
+    return counter.count
+
+
+def count_both_ways_stream(snippet, source, chunk_size=1 << 20):
+    # Counts from anything with a read method (a text or binary file, or an mmap), one chunk at a time,
+    # so memory use does not grow with the size of the input.
+    # A str snippet is searched for in binary input by its UTF-8 encoding.
+    # Each chunk is searched with find and count (in C) rather than by the automata of BothWaysCounter.
+    # The last len(snippet) - 1 characters of each chunk are carried over to the front of the next, so a match
+    # that crosses from one chunk into the next is found there; none fits in the carried part alone,
+    # so none is counted twice.
+    chunk = source.read(chunk_size)
+    if isinstance(chunk, bytes) and isinstance(snippet, str):
+        forward, backward = snippet.encode('utf-8'), snippet[::-1].encode('utf-8')
+    else:
+        forward, backward = snippet, snippet[::-1]
+    if not forward:
+        return 0
+    forward_overlaps, backward_overlaps = can_overlap(forward), can_overlap(backward)
+    count: int = 0
+    tail = chunk[:0]
+    while chunk:
+        block = tail + chunk
+        count += count_overlapping(block, forward, forward_overlaps) + count_overlapping(block, backward, backward_overlaps)
+        tail = block[max(len(block) - len(forward) + 1, 0):]
+        chunk = source.read(chunk_size)
+    return count
+
+
+def can_overlap(pattern):
+    # Whether two occurrences of the pattern can overlap: that is, whether it starts with one of its own proper suffixes.
+    return any(pattern[:size] == pattern[-size:] for size in range(1, len(pattern)))
+
+
+def count_overlapping(text, pattern, overlaps=True):
+    # Counts every occurrence of the pattern in the text, overlapping ones included. count only finds
+    # occurrences that do not overlap, which is all of them when they cannot; otherwise find is called once per match.
+    if not overlaps:
+        return text.count(pattern)
+    count: int = 0
+    position: int = text.find(pattern)
+    while position >= 0:
+        count += 1
+        position = text.find(pattern, position + 1)
+    return count
+
+
+def count_both_ways_in_file(snippet, path, chunk_size=1 << 20):
+    # Memory-maps the file, so that the operating system rather than Python holds its pages.
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return count_both_ways_stream(snippet, mapped, chunk_size)
+
+
+def count_many_both_ways(snippets, phrase):
+    # Counts every snippet forwards and backwards, as count_both_ways does, in one pass over the phrase.
+    counter = ManyWaysCounter(snippets)
+    counter.feed(phrase)
+    return counter.counts()
+
+
+def build_automaton(pattern):
+    # Each state is the number of characters of the pattern matched so far (as in Knuth-Morris-Pratt).
+    # transitions[state] maps a character to the next state; any character not listed goes back to 0.
+    transitions = [{pattern[0]: 1}]
+    fallback = 0
+    for state in range(1, len(pattern) + 1):
+        row = dict(transitions[fallback])
+        if state < len(pattern):
+            row[pattern[state]] = state + 1
+            fallback = transitions[fallback].get(pattern[state], 0)
+        transitions.append(row)
+    return transitions
+
+
+class BothWaysCounter:
+    # Counts overlapping occurrences of a snippet read forwards and backwards in a single pass.
+    # Rather than reversing the text, it looks for the reversed snippet in the text as it is.
+    # Text can be fed in pieces; matches that cross from one piece into the next are still counted,
+    # since the automata carry what they have matched so far from one piece to the next.
+    # With an encoding, the snippet is encoded (after being reversed, for the backward search) to count in bytes.
+    def __init__(self, snippet, encoding=None):
+        forward_snippet = snippet
+        backward_snippet = snippet[::-1]
+        if encoding is not None:
+            forward_snippet = forward_snippet.encode(encoding)
+            backward_snippet = backward_snippet.encode(encoding)
+        self.count = 0
+        self.length = len(forward_snippet)
+        if self.length:
+            self.forward = build_automaton(forward_snippet)
+            self.backward = build_automaton(backward_snippet)
+        self.forward_state = 0
+        self.backward_state = 0
+
+    def feed(self, text):
+        if not self.length:
+            return
+        forward, backward, length = self.forward, self.backward, self.length
+        forward_state, backward_state = self.forward_state, self.backward_state
+        count = 0
+        for char in text:
+            forward_state = forward[forward_state].get(char, 0)
+            backward_state = backward[backward_state].get(char, 0)
+            if forward_state == length:
+                count += 1
+            if backward_state == length:
+                count += 1
+        self.count += count
+        self.forward_state, self.backward_state = forward_state, backward_state
+
+
+class ManyWaysCounter:
+    # Counts many snippets forwards and backwards at once with an Aho-Corasick automaton.
+    # The automaton is a trie of every snippet and reversed snippet; each state is a node of the trie,
+    # and its failure link points to the node for the longest proper suffix that is also in the trie.
+    # Feeding text only counts visits to each state; a visit to a state is also a visit to every state
+    # along its failure links, so the totals for each snippet are added up once, when they are asked for.
+    def __init__(self, snippets, encoding=None):
+        self.children = [{}]
+        self.ends = {}
+        for snippet in snippets:
+            if snippet:
+                forward_snippet = snippet
+                backward_snippet = snippet[::-1]
+                if encoding is not None:
+                    forward_snippet = forward_snippet.encode(encoding)
+                    backward_snippet = backward_snippet.encode(encoding)
+                self.ends[snippet] = (self.insert(forward_snippet), self.insert(backward_snippet))
+            else:
+                self.ends[snippet] = None
+
+        # Breadth-first, so that a node's failure link is finished before the node itself.
+        # transitions[node] holds the node's children and, through its failure link, every other way on.
+        self.failure = [0] * len(self.children)
+        self.transitions = [None] * len(self.children)
+        self.transitions[0] = self.children[0]
+        self.order = []
+        queue = collections.deque(self.children[0].values())
+        while queue:
+            node = queue.popleft()
+            self.order.append(node)
+            row = dict(self.transitions[self.failure[node]])
+            row.update(self.children[node])
+            self.transitions[node] = row
+            for char, child in self.children[node].items():
+                self.failure[child] = self.transitions[self.failure[node]].get(char, 0) if node else 0
+                queue.append(child)
+        self.visits = [0] * len(self.children)
+        self.state = 0
+
+    def insert(self, pattern):
+        node = 0
+        for char in pattern:
+            if char not in self.children[node]:
+                self.children[node][char] = len(self.children)
+                self.children.append({})
+            node = self.children[node][char]
+        return node
+
+    def feed(self, text):
+        transitions, visits, state = self.transitions, self.visits, self.state
+        for char in text:
+            state = transitions[state].get(char, 0)
+            visits[state] += 1
+        self.state = state
+
+    def counts(self):
+        totals = list(self.visits)
+        for node in reversed(self.order):
+            totals[self.failure[node]] += totals[node]
+        return {snippet: totals[ends[0]] + totals[ends[1]] if ends else 0 for snippet, ends in self.ends.items()}
+
+
+if __name__ == "__main__":
+    print(count_both_ways('ab', 'when i am able, i will go back inside.'))  # should return 2
+    print(count_both_ways('aw', 'if a swatch of the paint was watery,  what does that say about the product?'))  # should return 3
+    print(count_both_ways('b', "there's nothing to be afraid of but me."))  # should return 4
+    print(count_both_ways('xy', 'are you ready?'))  # should return 0
+    print(count_both_ways('ti', 'this is it!'))  # should return 1
+    print(count_many_both_ways(['ab', 'b', 'xy'], 'when i am able, i will go back inside.'))  # should return {'ab': 2, 'b': 4, 'xy': 0}
@@ -1,13 +1,139 @@
-def factorial(number):
+import bisect
+
+
+def product_range(low, high):
+    # Multiplies low * (low + 1) * ... * (high - 1) by splitting the range in halves,
+    # so that the big multiplications are between numbers of about the same size.
+    if high - low <= 8:
+        result: int = 1
+        for number in range(low, high):
+            result = result * number
+        return result
+    middle: int = (low + high) // 2
+    return product_range(low, middle) * product_range(middle, high)
+
+
+def product_tree(numbers):
+    # Multiplies a list of numbers in pairs, then the pairs in pairs, and so on.
+    while len(numbers) > 1:
+        paired = [numbers[index] * numbers[index + 1] for index in range(0, len(numbers) - 1, 2)]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+    return numbers[0] if numbers else 1
+
+
+def primes_up_to(number):
+    # The sieve of Eratosthenes, with one byte per number.
+    if number < 2:
+        return []
+    sieve = bytearray([1]) * (number + 1)
+    sieve[0] = sieve[1] = 0
+    for prime in range(2, int(number ** 0.5) + 1):
+        if sieve[prime]:
+            sieve[prime * prime::prime] = bytes(len(range(prime * prime, number + 1, prime)))
+    return [prime for prime, is_prime in enumerate(sieve) if is_prime]
+
+
+def swing(number, primes):
+    # The swinging factorial, number! / (number // 2)! ** 2, from its prime factors.
+    # Each prime p appears once for every k with number // p ** k odd.
+    factors = []
+    for prime in primes:
+        if prime > number:
+            break
+        power: int = 1
+        quotient: int = number // prime
+        while quotient:
+            if quotient & 1:
+                power = power * prime
+            quotient = quotient // prime
+        if power > 1:
+            factors.append(power)
+    return product_tree(factors)
+
+
+def swing_factorial(number):
+    # number! = (number // 2)! ** 2 * swing(number), applied all the way down.
+    if number < 2:
+        return 1
+    primes = primes_up_to(number)
+    halvings = []
+    while number >= 2:
+        halvings.append(number)
+        number = number // 2
+    result: int = 1
+    for number in reversed(halvings):
+        result = result * result * swing(number, primes)
+    return result
+
+
+class FactorialCache:
+    # Keeps the factorials already computed, so that a later call only multiplies from the nearest one below it.
+    # Once there are more than max_entries, or they take more than max_bits between them, the oldest are dropped first;
+    # a factorial larger than max_bits on its own is returned without being kept at all.
+    # The method, 'split' or 'swing', is used for any factorial with nothing cached close enough below it.
+    def __init__(self, max_entries=16, max_bits=1 << 26, method='split'):
+        self.max_entries = max_entries
+        self.max_bits = max_bits
+        self.method = method
+        self.values = {0: 1}
+        self.keys = [0]
+        self.total_bits = 0
+
+    def factorial(self, number):
+        if number < 1:
+            return 1
+        if number in self.values:
+            return self.values[number]
+        nearest: int = self.keys[bisect.bisect_right(self.keys, number) - 1]
+        if number - nearest <= nearest:
+            result: int = self.values[nearest] * product_range(nearest + 1, number + 1)
+        elif self.method == 'swing':
+            result = swing_factorial(number)
+        else:
+            result = product_range(1, number + 1)
+        self.store(number, result)
+        return result
+
+    def store(self, number, result):
+        if result.bit_length() > self.max_bits:
+            return
+        self.values[number] = result
+        bisect.insort(self.keys, number)
+        self.total_bits = self.total_bits + result.bit_length()
+        while len(self.values) > self.max_entries or self.total_bits > self.max_bits:
+            oldest = next(key for key in self.values if key != 0)
+            self.total_bits = self.total_bits - self.values.pop(oldest).bit_length()
+            self.keys.remove(oldest)
+
+
+def factorial(number, cache=None):
+    # Caching is opt-in: pass a FactorialCache to keep results between calls, and nothing is kept otherwise.
+    if cache is not None:
+        return cache.factorial(number)
+    return product_range(1, number + 1)
+
+
+def factorial_mod(number, modulus):
+    # number! % modulus, keeping every intermediate value below the modulus.
+    # Once number reaches the modulus, the modulus itself is one of the factors, so the answer is 0.
+    if modulus < 1:
+        raise ValueError("The modulus must be a positive integer, not " + str(modulus) + ".")
+    if modulus == 1 or number >= modulus:
+        return 0
     result: int = 1
-    while number >= 1:
-        result = result * number
-        number = number - 1
+    for factor in range(2, number + 1):
+        result = result * factor % modulus
     return result
 
 
-print(factorial(0))  # should return 1
-print(factorial(1))  # should return 1
-print(factorial(3))  # should return 6
-print(factorial(4))  # should return 24
-print(factorial(5))  # should return 120
+if __name__ == "__main__":
+    print(factorial(0))  # should return 1
+    print(factorial(1))  # should return 1
+    print(factorial(3))  # should return 6
+    print(factorial(4))  # should return 24
+    print(factorial(5))  # should return 120
+    cache = FactorialCache()
+    print(factorial(20, cache) // factorial(18, cache))  # should return 380
+    print(factorial_mod(20, 1000003))  # should return 511524
@@ -1,3 +1,7 @@
+import mmap
+import os
+
+
 def reverse(sequence):
     """
     The following function takes a string. It returns that string in a reversed order.
@@ -7,12 +11,98 @@ def reverse(sequence):
     return sequence[::-1]
 
 
-def is_palindrome(string):
-    palindrome_bool = False
-    if string == reverse(string):
-        palindrome_bool = True
-    return palindrome_bool
+def is_palindrome(string, normalized=False, block_size=4096):
+    """
+    The following function determines whether a sequence reads the same forwards and backwards.
+    Rather than reversing the whole sequence, it compares the front and the back, moving inwards,
+    and stops at the first difference. It works on str, bytes, bytearray, memoryview, and mmap objects.
+    :param string: a sequence to be checked.
+    :param normalized: a bool as to whether to ignore case and anything other than letters and digits.
+    :param block_size: the number of items compared at once from each end when not normalized.
+    :return: a bool as to whether the sequence is a palindrome.
+    """
+    if normalized:
+        return is_normalized_palindrome(string)
+    left = 0
+    right = len(string)
+    while right - left > 1:
+        size = min(block_size, (right - left) // 2)
+        if string[left:left + size] != string[right - size:right][::-1]:
+            return False
+        left += size
+        right -= size
+    return True
+
+
+# Lowercase ASCII letters and digits by byte value, and an empty string for everything that is ignored.
+BYTE_FOLDS = [chr(value).lower() if chr(value).isalnum() else '' for value in range(128)] + [''] * 128
+
+
+def fold(item):
+    """
+    The following function folds one item of a sequence for a normalized comparison.
+    :param item: a character, or a byte value.
+    :return: the casefolded character, which may be several characters long (as 'ß' folds to 'ss'),
+    or an empty string if the item is ignored.
+    """
+    if isinstance(item, int):
+        return BYTE_FOLDS[item]
+    return item.casefold() if item.isalnum() else ''
+
+
+def is_normalized_palindrome(string):
+    """
+    The following function determines whether a sequence is a palindrome, ignoring case and
+    anything other than letters and digits. Case is ignored with casefold, so 'ß' matches 'SS'.
+    It folds and skips items in place as it goes, so no cleaned-up copy of the sequence is made:
+    each end keeps only the fold of its current item and how much of that fold it has compared.
+    Bytes are taken to be ASCII.
+    :param string: a sequence to be checked.
+    :return: a bool as to whether the sequence is a palindrome.
+    """
+    left = 0
+    right = len(string) - 1
+    left_fold = right_fold = None
+    left_used = right_used = 0
+    while left <= right:
+        if left_fold is None:
+            left_fold, left_used = fold(string[left]), 0
+        if right_fold is None:
+            right_fold, right_used = fold(string[right]), 0
+        if left_used == len(left_fold):
+            left += 1
+            left_fold = None
+        elif right_used == len(right_fold):
+            right -= 1
+            right_fold = None
+        elif left == right and left_used >= len(left_fold) - right_used - 1:
+            # Both ends have reached the middle of the same item's fold.
+            return True
+        elif left_fold[left_used] != right_fold[-1 - right_used]:
+            return False
+        else:
+            left_used += 1
+            right_used += 1
+    return True
+
+
+def is_palindrome_file(path, normalized=False):
+    """
+    The following function determines whether the bytes of a file form a palindrome.
+    The file is memory-mapped rather than read, so it is never copied into memory as a whole.
+    :param path: the path of the file.
+    :param normalized: a bool as to whether to ignore case and anything other than ASCII letters and digits.
+    :return: a bool as to whether the file is a palindrome.
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return True
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return is_palindrome(mapped, normalized)
 
 
-print(is_palindrome("turnaround"))  # should return False
-print(is_palindrome("racecar"))  # should return True
+if __name__ == "__main__":
+    print(is_palindrome("turnaround"))  # should return False
+    print(is_palindrome("racecar"))  # should return True
+    print(is_palindrome("A man, a plan, a canal: Panama!", normalized=True))  # should return True
+    print(is_palindrome("ßSS", normalized=True))  # should return True
@@ -0,0 +1,202 @@
+import operator
+import re
+from array import array
+from itertools import compress, repeat
+
+# Translates a byte to 1 if it is zero and to 0 otherwise.
+ZERO_FLAGS = bytes([1]) + bytes(255)
+# Matches, in the output of matches(text, 1), a run of three or more equal characters.
+RUN_PATTERN = re.compile(b'\x01\x01+')
+# The text is compared this many characters at a time, so no full-size copy of it is ever made.
+CHUNK_SIZE = 1 << 16
+
+
+def matches(text, distance, excluding=None):
+    """
+    The following function compares every character with the one a distance after it, a chunk at a time:
+    the two stretches are read as ints and XORed, so equal characters leave zero bytes behind.
+    A str is encoded one chunk at a time (as ASCII if it can be, and otherwise as UTF-32, four bytes per character);
+    any other text is read through a memoryview, without copying it.
+    :param text: a str, bytes, bytearray, memoryview, or mmap object.
+    :param distance: how many characters apart the compared characters are.
+    :param excluding: optional flags, as returned by this function, of positions to leave out.
+    :return: a bytearray with a 1 at each position j whose character equals the one at j + distance
+    (and whose flag in excluding is 0), and 0 elsewhere.
+    """
+    size = max(len(text) - distance, 0)
+    flags = bytearray(size)
+    if isinstance(text, str):
+        encoding = 'ascii' if text.isascii() else 'utf-32-le'
+        view = text
+    else:
+        encoding = None
+        view = memoryview(text)
+    for start in range(0, size, CHUNK_SIZE):
+        end = min(start + CHUNK_SIZE, size)
+        first, second = view[start:end], view[start + distance:end + distance]
+        if encoding is not None:
+            first, second = first.encode(encoding), second.encode(encoding)
+        difference = int.from_bytes(first, 'little') ^ int.from_bytes(second, 'little')
+        difference = difference.to_bytes(len(first), 'little')
+        if encoding == 'utf-32-le':
+            chunk = bytes(map(operator.not_, memoryview(difference).cast('I')))
+        else:
+            chunk = difference.translate(ZERO_FLAGS)
+        if excluding is not None:
+            chunk = int.from_bytes(chunk, 'little')
+            chunk = (chunk ^ (chunk & int.from_bytes(excluding[start:end], 'little'))).to_bytes(end - start, 'little')
+        flags[start:end] = chunk
+    return flags
+
+
+class PalindromeIndex:
+    """
+    The following class finds every maximal palindrome in a text with Manacher's algorithm, in linear time.
+    For each position, it records the radius of the longest palindrome centered on it (odd lengths)
+    and of the longest palindrome centered just before it (even lengths). From those two numbers,
+    any question about the palindromes of the text can be answered without looking at the text again.
+    The text may be a str, bytes, bytearray, memoryview, or mmap object; it is never copied.
+    Most positions are never visited one at a time: a center whose neighbors differ has the shortest radius,
+    and inside a run of one repeated character every radius follows from the ends of the run,
+    so both are found with byte operations on whole chunks. Manacher's loop only visits the remaining centers.
+    Radii are kept as 4-byte ints, so the index keeps 8 bytes per character (and 3 more while it is built),
+    and texts must be shorter than 2 ** 31 characters.
+    """
+    def __init__(self, text):
+        """
+        The following method builds the index.
+        :param text: a sequence to be indexed.
+        """
+        self.text = text
+        length = len(text)
+        self.odd = array('i', [1]) * length
+        self.even = array('i', [0]) * length
+        odd, even = self.odd, self.even
+
+        # Only centers with equal neighbors can have more than the shortest radius. Those inside a run
+        # (text[i - 1] == text[i] == text[i + 1]) are filled in below, so Manacher's loop skips them.
+        same = matches(text, 1)
+        odd_centers = matches(text, 2, same)
+        even_centers = bytearray(same)
+
+        # Within a run text[start:end] of one character, a palindrome can only reach past the run
+        # if it is centered on the middle of the run; every other radius is its distance to the nearer end.
+        # A run of two has nothing else inside it, so only runs of three or more are filled in here.
+        ramp = array('i', [1])
+        for run in RUN_PATTERN.finditer(same):
+            start, end = run.start(), run.end() + 1
+            size = end - start
+            while len(ramp) < (size + 1) // 2:
+                ramp = array('i', range(1, 2 * len(ramp) + 1))
+            odd[start:start + (size + 1) // 2] = ramp[:(size + 1) // 2]
+            odd[start + (size + 1) // 2:end] = ramp[size // 2 - 1::-1]
+            even[start + 1:start + 1 + size // 2] = ramp[:size // 2]
+            even[start + 1 + size // 2:end] = ramp[(size - 1) // 2 - 1::-1]
+            even_centers[start:end - 1] = bytes(size - 1)
+            if size % 2:
+                odd_centers[start + size // 2 - 1] = 1
+            else:
+                even_centers[start + size // 2 - 1] = 1
+
+        # odd[i] palindromes of odd length are centered on i; the longest is text[i - odd[i] + 1:i + odd[i]].
+        left, right = 0, -1
+        i = odd_centers.find(1)
+        while i >= 0:
+            i = i + 1
+            radius = odd[i]
+            if i <= right:
+                radius = max(radius, min(odd[left + right - i], right - i + 1))
+            while radius <= i and i + radius < length and text[i - radius] == text[i + radius]:
+                radius += 1
+            odd[i] = radius
+            if i + radius - 1 > right:
+                left, right = i - radius + 1, i + radius - 1
+            i = odd_centers.find(1, i)
+
+        # even[i] palindromes of even length are centered just before i; the longest is text[i - even[i]:i + even[i]].
+        left, right = 0, -1
+        i = even_centers.find(1)
+        while i >= 0:
+            i = i + 1
+            radius = even[i]
+            if i <= right:
+                radius = max(radius, min(even[left + right - i + 1], right - i + 1))
+            while radius < i and i + radius < length and text[i - radius - 1] == text[i + radius]:
+                radius += 1
+            even[i] = radius
+            if i + radius - 1 > right:
+                left, right = i - radius, i + radius - 1
+            i = even_centers.find(1, i)
+
+    def spans_at(self, position):
+        """
+        The following method finds the longest palindromes centered at a position.
+        :param position: an index into the text.
+        :return: a tuple of the (start, end) spans of the longest palindrome centered on the position
+        and of the longest palindrome centered just before it (which is empty if there is none).
+        """
+        odd_radius = self.odd[position]
+        even_radius = self.even[position]
+        return ((position - odd_radius + 1, position + odd_radius),
+                (position - even_radius, position + even_radius))
+
+    def is_palindrome(self, start, end):
+        """
+        The following method determines whether text[start:end] is a palindrome, in constant time.
+        :param start: the index at which the span begins.
+        :param end: the index after the one at which the span ends.
+        :return: a bool as to whether the span is a palindrome.
+        """
+        half = (end - start) // 2
+        if end - start <= 1:
+            return True
+        if (end - start) % 2:
+            return self.odd[start + half] > half
+        return self.even[start + half] >= half
+
+    def maximal_palindromes(self, minimum_length=2):
+        """
+        The following method lists the maximal palindromes of the text: those centered at each position
+        that cannot be extended at both ends.
+        :param minimum_length: the shortest palindrome to list.
+        :return: a generator of (start, end) spans, in order of their centers.
+        """
+        # The positions with a long enough palindrome are picked out with map and compress, without a Python loop.
+        long_odd = map(operator.ge, self.odd, repeat((minimum_length + 2) // 2))
+        long_even = map(operator.ge, self.even, repeat(max((minimum_length + 1) // 2, 1)))
+        for position in compress(range(len(self.text)), map(operator.or_, long_odd, long_even)):
+            odd_span, even_span = self.spans_at(position)
+            if even_span[1] - even_span[0] >= minimum_length:
+                yield even_span
+            if odd_span[1] - odd_span[0] >= minimum_length:
+                yield odd_span
+
+    def longest(self):
+        """
+        The following method finds the longest palindrome in the text (the first, if there is a tie).
+        :return: a (start, end) span, which is empty only if the text is.
+        """
+        if not self.odd:
+            return 0, 0
+        odd_radius, even_radius = max(self.odd), max(self.even)
+        # Odd and even lengths never tie, so the longest is the first of the longer kind.
+        if 2 * even_radius > 2 * odd_radius - 1:
+            position = self.even.index(even_radius)
+            return position - even_radius, position + even_radius
+        position = self.odd.index(odd_radius)
+        return position - odd_radius + 1, position + odd_radius
+
+
+def longest_palindrome(text):
+    """
+    The following function finds the longest palindromic substring of a text.
+    :param text: a sequence to be searched.
+    :return: the longest palindrome, of the same type as the text.
+    """
+    start, end = PalindromeIndex(text).longest()
+    return text[start:end]
+
+
+if __name__ == "__main__":
+    print(longest_palindrome("turnaround"))  # should return "t" (no two neighboring letters match, so no palindrome is longer)
+    print(longest_palindrome("my racecar is fast"))  # should return " racecar "
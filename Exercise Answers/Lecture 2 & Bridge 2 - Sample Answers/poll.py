@@ -1,40 +1,375 @@
 # Lecture 2, Exercise 1:
-def poll(question, answer_one, answer_two, answer_three, answer_four, num_pollers):
-    print("Current Poll:")
-    print(question)
-    print(answer_one)
-    print(answer_two)
-    print(answer_three)
-    print(answer_four)
-    print("")
-    print("Give your response here:")
-
-    a1_count: int = 0
-    a2_count: int = 0
-    a3_count: int = 0
-    a4_count: int = 0
+import asyncio
+import builtins
+import collections
+import concurrent.futures
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+
+# A snapshot starts with this header: the magic bytes, the numbers of options, of completed sources,
+# and of partly counted sources, and the number of invalid responses. Every integer in a snapshot is little-endian.
+SNAPSHOT_MAGIC = b'PLT2'
+SNAPSHOT_HEADER = struct.Struct('<4sIIIq')
+TEXT_LENGTH = struct.Struct('<I')
+
+
+class PollEngine:
+    # Tallies the responses to a poll with any number of options.
+    # Each option is found through a dict from option to position, so matching a response takes one lookup
+    # however many options there are. Responses that match no option are counted as invalid.
+    # Tallies of the same options add up exactly, so a poll can be split into shards (such as one per file),
+    # counted in separate processes, and merged. A lock is held whenever tallies are added or read,
+    # so the results can be asked for from another thread while ingestion keeps going.
+    # Each source (a file, a named stream, or a named producer) is either completed, or has an offset:
+    # how far into it has been counted, in its own units. The offset is updated together with the counts,
+    # so a snapshot taken at any moment can be resumed without counting anything twice.
+    def __init__(self, options):
+        self.options = list(options)
+        self.index = {}
+        for position, option in enumerate(self.options):
+            self.index.setdefault(option, position)
+        self.counts = [0] * len(self.options)
+        self.invalid = 0
+        self.completed = set()
+        self.offsets = {}
+        self.lock = threading.Lock()
+
+    def record(self, response):
+        # Counts one response; returns whether it was valid.
+        position = self.index.get(response)
+        with self.lock:
+            if position is None:
+                self.invalid = self.invalid + 1
+                return False
+            self.counts[position] = self.counts[position] + 1
+            return True
+
+    def ingest(self, responses, source=None, offset=None):
+        # Counts any iterable of responses. collections.Counter tallies them (in C), so each distinct
+        # response is only looked up once, however many times it was given.
+        # With a source, offset is how far into it these responses reach, or None if they finish it.
+        index, counts = self.index, self.counts
+        tally = collections.Counter(responses)
+        with self.lock:
+            for response, count in tally.items():
+                position = index.get(response)
+                if position is None:
+                    self.invalid = self.invalid + count
+                else:
+                    counts[position] = counts[position] + count
+            if source is not None:
+                if offset is None:
+                    self.offsets.pop(source, None)
+                    self.completed.add(source)
+                else:
+                    self.offsets[source] = offset
+
+    def offset(self, source):
+        # How far into a source has been counted: 0 if it has not been started (or has no name),
+        # and None if it has been counted in full.
+        with self.lock:
+            if source in self.completed:
+                return None
+            return self.offsets.get(source, 0)
+
+    def checkpoint(self, snapshot_path, snapshot_interval, last_snapshot):
+        # Saves a snapshot if snapshot_interval seconds have passed since the last one; returns when the latest was saved.
+        if snapshot_path is not None and time.monotonic() - last_snapshot >= snapshot_interval:
+            self.save_snapshot(snapshot_path)
+            return time.monotonic()
+        return last_snapshot
+
+    def ingest_stream(self, source, chunk_size=1 << 20, name=None, snapshot_path=None, snapshot_interval=60.0):
+        # Counts the responses in anything with a read method that gives text, one response per line,
+        # reading it one chunk at a time. A line split between two chunks is put back together first.
+        # With a name, the offset kept for the stream is the number of characters up to the last complete line
+        # counted, and a stream that was partly counted before (as after resuming from a snapshot)
+        # has that many characters read and skipped. With a snapshot_path, a snapshot is saved
+        # at most every snapshot_interval seconds, and once the stream is done.
+        offset = self.offset(name)
+        if offset is None:
+            return
+        skipped: int = 0
+        while skipped < offset:
+            chunk: str = source.read(min(chunk_size, offset - skipped))
+            if not chunk:
+                raise ValueError("The stream " + str(name) + " is shorter than the offset it was counted to.")
+            skipped = skipped + len(chunk)
+        last_snapshot: float = time.monotonic()
+        remainder: str = ''
+        chunk = source.read(chunk_size)
+        while chunk:
+            offset = offset + len(chunk)
+            lines: list = (remainder + chunk).split('\n')
+            remainder = lines.pop()
+            self.ingest(lines, name, offset - len(remainder))
+            last_snapshot = self.checkpoint(snapshot_path, snapshot_interval, last_snapshot)
+            chunk = source.read(chunk_size)
+        self.ingest([remainder] if remainder else [], name, None)
+        if snapshot_path is not None:
+            self.save_snapshot(snapshot_path)
+
+    def ingest_file(self, path, encoding='utf-8', chunk_size=1 << 20, snapshot_path=None, snapshot_interval=60.0):
+        # Counts a file of responses as ingest_stream does, but reads it as bytes, so that the offset kept
+        # for the file is the byte just after the last complete line counted; a file that was partly counted
+        # is read on from there. The encoding must write '\n' as the byte 10, as UTF-8 and other ASCII-based
+        # encodings do. Lines may end in '\n' or '\r\n'.
+        offset = self.offset(path)
+        if offset is None:
+            return
+        last_snapshot: float = time.monotonic()
+        with open(path, 'rb') as file:
+            file.seek(offset)
+            remainder: bytes = b''
+            chunk: bytes = file.read(chunk_size)
+            while chunk:
+                block: bytes = remainder + chunk
+                end: int = block.rfind(b'\n') + 1
+                if end:
+                    offset = offset + end
+                    self.ingest(split_lines(block[:end], encoding), path, offset)
+                    last_snapshot = self.checkpoint(snapshot_path, snapshot_interval, last_snapshot)
+                remainder = block[end:]
+                chunk = file.read(chunk_size)
+        self.ingest(split_lines(remainder + b'\n', encoding) if remainder else [], path, None)
+        if snapshot_path is not None:
+            self.save_snapshot(snapshot_path)
+
+    async def consume(self, queue, snapshot_path=None, snapshot_interval=60.0):
+        # Counts the batches of responses put on an asyncio.Queue, as (source, offset, batch) tuples,
+        # until it is given None. Snapshots are written in another thread, so the event loop keeps running.
+        last_snapshot: float = time.monotonic()
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                source, offset, batch = item
+                self.ingest(batch, source, offset)
+                if snapshot_path is not None and time.monotonic() - last_snapshot >= snapshot_interval:
+                    await asyncio.to_thread(self.save_snapshot, snapshot_path)
+                    last_snapshot = time.monotonic()
+            finally:
+                queue.task_done()
+
+    async def ingest_async(self, producers, max_batches=64, snapshot_path=None, snapshot_interval=60.0):
+        # Counts the batches of responses from many producers (async iterables) as they arrive.
+        # They all feed one queue with a single consumer, so the tallies are only ever updated by one task at a time;
+        # a full queue holds the producers back until the consumer catches up.
+        # Given as a dict from name to producer, the offset kept for each producer is the number of its batches
+        # counted, and a producer that was partly counted before has that many batches skipped, so a poll
+        # fed again by the same producers picks up where its snapshot left off. With a snapshot_path,
+        # a snapshot is saved at most every snapshot_interval seconds, and once all producers are done.
+        queue = asyncio.Queue(max_batches)
+        named = producers.items() if isinstance(producers, dict) else [(None, producer) for producer in producers]
+
+        async def produce(name, producer):
+            skipped = self.offset(name)
+            if skipped is None:
+                return
+            offset: int = 0
+            async for batch in producer:
+                offset = offset + 1
+                if offset > skipped:
+                    await queue.put((name, offset, batch))
+            if name is not None:
+                await queue.put((name, None, ()))
+
+        async def unless_consumer_fails(awaitable):
+            # Nothing is left waiting on a full queue if the consumer fails: its error is raised instead.
+            waiting = asyncio.ensure_future(awaitable)
+            try:
+                await asyncio.wait([waiting, consumer], return_when=asyncio.FIRST_COMPLETED)
+                if not waiting.done():
+                    consumer.result()
+                return await waiting
+            finally:
+                waiting.cancel()
+                await asyncio.gather(waiting, return_exceptions=True)
+
+        consumer = asyncio.create_task(self.consume(queue, snapshot_path, snapshot_interval))
+        try:
+            await unless_consumer_fails(asyncio.gather(*(produce(name, producer) for name, producer in named)))
+            await unless_consumer_fails(queue.put(None))
+            await consumer
+        finally:
+            consumer.cancel()
+        if snapshot_path is not None:
+            await asyncio.to_thread(self.save_snapshot, snapshot_path)
+
+    def merge_counts(self, counts, invalid, source=None):
+        # Adds the tallies of a shard, given as per-option counts in the same order as the options,
+        # and marks the source the shard came from as completed.
+        if len(counts) != len(self.counts):
+            raise ValueError("Expected " + str(len(self.counts)) + " counts, got " + str(len(counts)) + ".")
+        with self.lock:
+            for position, count in enumerate(counts):
+                self.counts[position] = self.counts[position] + count
+            self.invalid = self.invalid + invalid
+            if source is not None:
+                self.offsets.pop(source, None)
+                self.completed.add(source)
+
+    def merge(self, other):
+        if other.options != self.options:
+            raise ValueError("Only polls with the same options can be merged.")
+        with other.lock:
+            counts, invalid, completed = list(other.counts), other.invalid, set(other.completed)
+        self.merge_counts(counts, invalid)
+        with self.lock:
+            self.completed.update(completed)
+        return self
+
+    def ingest_files(self, paths, max_workers=None, snapshot_path=None, snapshot_interval=60.0, encoding='utf-8'):
+        # Counts many files of responses across a pool of processes, one file per task, and merges the tallies
+        # of each file as soon as it is done. Files already completed (as after resuming from a snapshot) are skipped,
+        # and files partly counted by ingest_file are counted on from their offsets.
+        # With a snapshot_path, a snapshot is saved at most every snapshot_interval seconds, and once all files are done.
+        pending: list = [(path, self.offset(path)) for path in paths]
+        last_snapshot: float = time.monotonic()
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(tally_file, self.options, path, encoding, offset)
+                       for path, offset in pending if offset is not None]
+            for future in concurrent.futures.as_completed(futures):
+                path, counts, invalid = future.result()
+                self.merge_counts(counts, invalid, path)
+                last_snapshot = self.checkpoint(snapshot_path, snapshot_interval, last_snapshot)
+        if snapshot_path is not None:
+            self.save_snapshot(snapshot_path)
+
+    def save_snapshot(self, path):
+        # Writes the tallies to a compact binary file: the header, the options, the completed sources,
+        # and the partly counted sources as length-prefixed UTF-8, then the counts and the offsets
+        # of the partly counted sources as arrays of 64-bit integers.
+        # The file is written in full and synced under a temporary name, which then replaces the old snapshot,
+        # and the directory is synced so that the replacement itself survives a power loss;
+        # a crash at any point leaves either the old snapshot or the new one.
+        with self.lock:
+            counts = array('q', self.counts)
+            invalid: int = self.invalid
+            completed: list = sorted(self.completed)
+            partial: list = sorted(self.offsets)
+            offsets = array('q', [self.offsets[source] for source in partial])
+        if sys.byteorder == 'big':
+            counts.byteswap()
+            offsets.byteswap()
+        parts: list = [SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(self.options), len(completed), len(partial), invalid)]
+        for text in self.options + completed + partial:
+            encoded: bytes = text.encode('utf-8')
+            parts.append(TEXT_LENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        parts.append(counts.tobytes())
+        parts.append(offsets.tobytes())
+        temporary_path: str = path + '.tmp'
+        with open(temporary_path, 'wb') as file:
+            file.write(b''.join(parts))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+        if os.name == 'posix':
+            directory: int = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+
+    @classmethod
+    def load_snapshot(cls, path):
+        with open(path, 'rb') as file:
+            data: bytes = file.read()
+        magic, num_options, num_completed, num_partial, invalid = SNAPSHOT_HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(path + " is not a poll snapshot.")
+        offset: int = SNAPSHOT_HEADER.size
+        texts: list = []
+        for _ in range(num_options + num_completed + num_partial):
+            length, = TEXT_LENGTH.unpack_from(data, offset)
+            offset = offset + TEXT_LENGTH.size
+            texts.append(data[offset:offset + length].decode('utf-8'))
+            offset = offset + length
+        numbers = array('q')
+        numbers.frombytes(data[offset:])
+        if sys.byteorder == 'big':
+            numbers.byteswap()
+        if len(numbers) != num_options + num_partial:
+            raise ValueError(path + " is truncated.")
+        engine = cls(texts[:num_options])
+        engine.merge_counts(numbers[:num_options], invalid)
+        engine.completed.update(texts[num_options:num_options + num_completed])
+        engine.offsets.update(zip(texts[num_options + num_completed:], numbers[num_options:]))
+        return engine
+
+    @classmethod
+    def resume(cls, options, snapshot_path):
+        # Picks a poll up from its snapshot if there is one, and otherwise starts it afresh.
+        if not os.path.exists(snapshot_path):
+            return cls(options)
+        engine = cls.load_snapshot(snapshot_path)
+        if engine.options != list(options):
+            raise ValueError(snapshot_path + " is a snapshot of a poll with other options.")
+        return engine
+
+    def results(self):
+        with self.lock:
+            return dict(zip(self.options, self.counts))
+
+    def total(self):
+        with self.lock:
+            return sum(self.counts)
+
+    def report(self, console=builtins):
+        with self.lock:
+            counts = list(self.counts)
+        console.print("Poll results:")
+        for option, count in zip(self.options, counts):
+            console.print(option + ": " + str(count))
+
+
+def tally_file(options, path, encoding='utf-8', offset=0):
+    # Counts one shard in a worker process, from a byte offset on; only the counts are sent back, not the engine.
+    engine = PollEngine(options)
+    engine.offsets[path] = offset
+    engine.ingest_file(path, encoding)
+    return path, engine.counts, engine.invalid
+
+
+def split_lines(block, encoding):
+    # The lines of a block of bytes that ends in a newline, decoded, without their '\n' or '\r\n'.
+    text: str = block.decode(encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n')
+    lines: list = text.split('\n')
+    lines.pop()
+    return lines
+
+
+def run_poll(question, options, num_pollers, console=builtins):
+    # Asks for responses until num_pollers of them are valid, then prints the results.
+    engine = PollEngine(options)
+    console.print("Current Poll:")
+    console.print(question)
+    for option in engine.options:
+        console.print(option)
+    console.print("")
+    console.print("Give your response here:")
 
     while num_pollers > 0:
-        poll_response: str = input(">> ")
-        if poll_response == answer_one:
-            a1_count = a1_count + 1
-            num_pollers = num_pollers - 1
-        elif poll_response == answer_two:
-            a2_count = a2_count + 1
-            num_pollers = num_pollers - 1
-        elif poll_response == answer_three:
-            a3_count = a3_count + 1
-            num_pollers = num_pollers - 1
-        elif poll_response == answer_four:
-            a4_count = a4_count + 1
+        poll_response: str = console.input(">> ")
+        if engine.record(poll_response):
             num_pollers = num_pollers - 1
         else:
-            print("That response was invalid.")
-    print("Poll results:")
-    print(answer_one + ": " + str(a1_count))
-    print(answer_two + ": " + str(a2_count))
-    print(answer_three + ": " + str(a3_count))
-    print(answer_four + ": " + str(a4_count))
+            console.print("That response was invalid.")
+    engine.report(console)
+    return engine
+
+
+def poll(question, answer_one, answer_two, answer_three, answer_four, num_pollers, console=builtins):
+    run_poll(question, [answer_one, answer_two, answer_three, answer_four], num_pollers, console)
 
 
-poll("How many errors did you get while writing this code?", "None", "Few", "Many", "Too Many", 5)
+if __name__ == "__main__":
+    poll("How many errors did you get while writing this code?", "None", "Few", "Many", "Too Many", 5)
@@ -1,129 +1,161 @@
 # Lecture 2, Exercise 2:
-
-# TODO: make alternative solution without global variable.
-# This is fine, but I'd expect them to do it via nested loops rather than a global variable.
-main_menu_value: int = 1
-
-
-def start_menu():
-    loop_condition: bool = True
-    while loop_condition:
-        menu_dialogue(main_menu_value)
-        user_input: str = input(">> ").strip()
-        if user_input == "Start":
-            start_dialogue()
-            input("Press enter to continue. (1/1)")
-        elif user_input == "Help":
-            help_dialogue()
-            input("Press enter to continue. (1/1)")
-        elif user_input == "Options":
-            options_menu()
-        elif user_input == "Quit":
-            loop_condition = False
-        else:
-            print("That input is not recognized. Please try again.")
-        print("")
-
-
-def menu_dialogue(mm_value):
-    if mm_value == 1:
-        print('--- MAIN MENU ---')
-        print('     - Start')
-        print('     - Help')
-        print('     - Options')
-        print('     - Quit')
-    elif mm_value == 2:
-        print('~~~~~ M A I N  M E N U ~~~~~')
-        print('     ~ Start')
-        print('     ~ Help')
-        print('     ~ Options')
-        print('     ~ Quit')
-    elif mm_value == 3:
-        print('* M * A * I * N * * M * E * N * U *')
-        print('     * Start')
-        print('     * Help')
-        print('     * Options')
-        print('     * Quit')
-    elif mm_value == 4:
-        print('/ MAIN MENU \\')
-        print('     | Start')
-        print('     | Help')
-        print('     | Options')
-        print('     | Quit')
-
-
-def start_dialogue():
-    print("This game isn't available yet. Sorry!")
-
-
-def help_dialogue():
-    print("On the start menu, current commands are: Start, Help, Options, and Quit.")
-    print("If this was a game program, Start would run the game.")
-    print("Meanwhile, Help gives this dialogue.")
-    print("The Options menu allows for changes to the menu to be made.")
-    print("Lastly, Quit ends the program.")
-
-
-def options_menu():
-    loop_condition: bool = True
-    while loop_condition:
-        options_dialogue()
-        user_input: list = input(">> ").split()
-        if user_input == "Help":
-            options_help_dialogue()
-            input("Press enter to continue. (1/1)")
-        elif user_input == "Controls":
-            print("This is where options for controls would go!")
-            input("Press enter to continue. (1/1)")
-        elif user_input == "Game":
-            print("This is where the game options would go!")
-            input("Press enter to continue. (1/1)")
-        elif user_input == "Menu":
-            print("There are four menus to select from! They are: ")
-            print('     1. Dashes')
-            print('     2. Tildes')
-            print('     3. Stars')
-            print('     4. Slashes')
-            print("Please select an option by number.")
-            switch_menu(input(">> ").split())
-            input("Press enter to continue. (1/1)")
-        elif user_input == "Back":
-            print("Proceeding back to the main menu...")
-            loop_condition = False
+import builtins
+
+MAIN_COMMANDS: list = ["Start", "Help", "Options", "Quit"]
+OPTIONS_COMMANDS: list = ["Help", "Controls", "Game", "Menu", "Back"]
+
+# The title and the bullet of each main menu style, by number.
+MENU_STYLES: dict = {
+    1: ('--- MAIN MENU ---', '     - '),
+    2: ('~~~~~ M A I N  M E N U ~~~~~', '     ~ '),
+    3: ('* M * A * I * N * * M * E * N * U *', '     * '),
+    4: ('/ MAIN MENU \\', '     | '),
+}
+
+
+def render_frame(title, bullet, commands):
+    # Lays out a whole menu as one string, so that it can be printed with a single call.
+    return "\n".join([title] + [bullet + command for command in commands])
+
+
+MENU_FRAMES: dict = {number: render_frame(title, bullet, MAIN_COMMANDS) for number, (title, bullet) in MENU_STYLES.items()}
+OPTIONS_FRAME: str = render_frame('--- OPTIONS ---', '     - ', OPTIONS_COMMANDS)
+HELP_TEXT: str = "\n".join([
+    "On the start menu, current commands are: Start, Help, Options, and Quit.",
+    "If this was a game program, Start would run the game.",
+    "Meanwhile, Help gives this dialogue.",
+    "The Options menu allows for changes to the menu to be made.",
+    "Lastly, Quit ends the program.",
+])
+OPTIONS_HELP_TEXT: str = "\n".join([
+    "On the options menu, current commands are: Help, Controls, Game, Menu, and Back.",
+    "Help brings up this menu.",
+    "Controls displays a message and would allow for a change of controls.",
+    "Game displays a message and would allow for change in options for the game itself.",
+    "Menu allows for a change in the Main Menu. There are up to four menu options (1, 2, 3, and 4).",
+    "Back returns to the Main Menu.",
+])
+STYLE_CHOICES_TEXT: str = "\n".join([
+    "There are four menus to select from! They are: ",
+    '     1. Dashes',
+    '     2. Tildes',
+    '     3. Stars',
+    '     4. Slashes',
+    "Please select an option by number.",
+])
+
+
+class StartMenu:
+    # The start menu and its options menu. The main menu style is kept here rather than in a global variable,
+    # and each command is found in a dict from command to method rather than by trying each in turn.
+    def __init__(self, style=1, console=builtins):
+        self.style = style
+        self.console = console
+        self.in_menu = False
+        self.main_commands = {"Start": self.start, "Help": self.help, "Options": self.options, "Quit": self.quit}
+        self.options_commands = {"Help": self.options_help, "Controls": self.controls, "Game": self.game,
+                                 "Menu": self.choose_style, "Back": self.back}
+
+    def run(self):
+        self.in_menu = True
+        while self.in_menu:
+            self.console.print(MENU_FRAMES[self.style])
+            user_input: str = self.console.input(">> ").strip()
+            self.main_commands.get(user_input, self.unrecognized)()
+            self.console.print("")
+
+    def start(self):
+        start_dialogue(self.console)
+        self.console.input("Press enter to continue. (1/1)")
+
+    def help(self):
+        help_dialogue(self.console)
+        self.console.input("Press enter to continue. (1/1)")
+
+    def options(self):
+        in_options: bool = True
+        while in_options:
+            options_dialogue(self.console)
+            user_input: str = self.console.input(">> ").strip()
+            command = self.options_commands.get(user_input)
+            if command is None:
+                self.console.print("That input is not recognized. Please try again.")
+                self.console.input("Press enter to continue. (1/1)")
+            else:
+                in_options = command()
+
+    def quit(self):
+        self.in_menu = False
+
+    def unrecognized(self):
+        self.console.print("That input is not recognized. Please try again.")
+
+    # Each command on the options menu returns whether to stay on the options menu.
+    def options_help(self):
+        options_help_dialogue(self.console)
+        self.console.input("Press enter to continue. (1/1)")
+        return True
+
+    def controls(self):
+        self.console.print("This is where options for controls would go!")
+        self.console.input("Press enter to continue. (1/1)")
+        return True
+
+    def game(self):
+        self.console.print("This is where the game options would go!")
+        self.console.input("Press enter to continue. (1/1)")
+        return True
+
+    def choose_style(self):
+        self.console.print(STYLE_CHOICES_TEXT)
+        self.switch_menu(self.console.input(">> ").strip())
+        self.console.input("Press enter to continue. (1/1)")
+        return True
+
+    def back(self):
+        self.console.print("Proceeding back to the main menu...")
+        return False
+
+    def switch_menu(self, menu_value):
+        try:
+            menu_value = int(menu_value, 10)
+        except ValueError:
+            self.console.print("That input is not recognized. Please try again.")
+            return
+        if menu_value > 0:
+            if menu_value < 5:
+                self.style = menu_value
+                self.console.print("The main menu has been changed.")
+            else:
+                self.console.print("The given value was too high. Please try again.")
         else:
-            print("That input is not recognized. Please try again.")
-            input("Press enter to continue. (1/1)")
-
-
-def options_dialogue():
-    print('--- OPTIONS ---')
-    print('     - Help')
-    print('     - Controls')
-    print('     - Game')
-    print('     - Menu')
-    print('     - Back')
-
-
-def options_help_dialogue():
-    print("On the options menu, current commands are: Help, Controls, Game, Menu, and Back.")
-    print("Help brings up this menu.")
-    print("Controls displays a message and would allow for a change of controls.")
-    print("Game displays a message and would allow for change in options for the game itself.")
-    print("Menu allows for a change in the Main Menu. There are up to four menu options (1, 2, 3, and 4).")
-    print("Back returns to the Main Menu.")
-
-
-def switch_menu(menu_value):
-    menu_value = int(menu_value, 10)
-    if menu_value > 0:
-        if menu_value < 5:
-            global main_menu_value
-            main_menu_value = menu_value
-            print("The main menu has been changed.")
-        else:
-            print("The given value was too high. Please try again.")
-    else:
-        print("The given value was too low. Please try again.")
+            self.console.print("The given value was too low. Please try again.")
+
+
+def start_menu(console=builtins):
+    StartMenu(console=console).run()
+
+
+def menu_dialogue(mm_value, console=builtins):
+    if mm_value in MENU_FRAMES:
+        console.print(MENU_FRAMES[mm_value])
+
+
+def start_dialogue(console=builtins):
+    console.print("This game isn't available yet. Sorry!")
+
+
+def help_dialogue(console=builtins):
+    console.print(HELP_TEXT)
+
+
+def options_dialogue(console=builtins):
+    console.print(OPTIONS_FRAME)
+
+
+def options_help_dialogue(console=builtins):
+    console.print(OPTIONS_HELP_TEXT)
 
 
-start_menu()
+if __name__ == "__main__":
+    start_menu()
@@ -1,4 +1,8 @@
 # Lecture 2, Exercise 3:
+import itertools
+import sys
+
+
 def when_ten_v2(number):
     if number == 10:
         print("Done!")
@@ -24,12 +28,63 @@ def when_ten_v3(number):
     print(difference)
 
 
-print("when_ten_v2:")
-when_ten_v2(10)
-when_ten_v2(15)
-when_ten_v2(5)
-print("")
-print("when_ten_v3:")
-when_ten_v3(10)
-when_ten_v3(15)
-when_ten_v3(5)
+def when_ten_lines(number):
+    # The lines that when_ten_v2 prints, one at a time and without recursing, so any distance from 10 will do.
+    line: str = "Too high!" if number > 10 else "Too low!"
+    yield from itertools.repeat(line, abs(number - 10))
+    yield "Done!"
+
+
+def when_ten_v4(number, file=None, max_lines=1 << 16):
+    # Writes what when_ten_v2 prints, but builds the repeated line with one string multiplication
+    # and writes it at once, max_lines lines at a time so that a long way from 10 does not fill up memory.
+    # Like print, it writes to whatever sys.stdout is when it is called, unless given a file.
+    if file is None:
+        file = sys.stdout
+    line: str = "Too high!\n" if number > 10 else "Too low!\n"
+    steps: int = abs(number - 10)
+    while steps > max_lines:
+        file.write(line * max_lines)
+        steps = steps - max_lines
+    file.write(line * steps + "Done!\n")
+
+
+def when_ten_batch(numbers, file=None, max_lines=1 << 16):
+    # Writes what when_ten_v4 writes for each of many numbers, gathering the output of
+    # up to max_lines lines before each write.
+    if file is None:
+        file = sys.stdout
+    pending: list = []
+    num_lines: int = 0
+    for number in numbers:
+        steps: int = abs(number - 10)
+        if steps >= max_lines:
+            file.write("".join(pending))
+            pending.clear()
+            num_lines = 0
+            when_ten_v4(number, file, max_lines)
+            continue
+        pending.append(("Too high!\n" if number > 10 else "Too low!\n") * steps + "Done!\n")
+        num_lines = num_lines + steps + 1
+        if num_lines >= max_lines:
+            file.write("".join(pending))
+            pending.clear()
+            num_lines = 0
+    file.write("".join(pending))
+
+
+if __name__ == "__main__":
+    print("when_ten_v2:")
+    when_ten_v2(10)
+    when_ten_v2(15)
+    when_ten_v2(5)
+    print("")
+    print("when_ten_v3:")
+    when_ten_v3(10)
+    when_ten_v3(15)
+    when_ten_v3(5)
+    print("")
+    print("when_ten_v4:")
+    when_ten_v4(10)
+    when_ten_v4(15)
+    when_ten_v4(5)
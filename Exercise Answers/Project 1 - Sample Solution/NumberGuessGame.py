@@ -7,142 +7,267 @@ The second will have the user supply an upper limit for a randomization of the n
 In both of the above games, the program reports back on each input whether it is above or
 below the target number. Both of these games can be accessed via a menu;
 there is also a help command for the game that displays instructions.
+Either game can also be played by a solver that halves the range of possible values with each guess,
+and many such games can be played at once to check how many guesses the solver needs.
 """
 
+import builtins
+import collections
 import random
 
 
-def known_hc() -> None:
+def known_hc(auto_play: bool = False, console=builtins) -> None:
     """
     This method executes the number-guessing game in which the seek value is known.
+    :param auto_play: a bool as to whether the solver, rather than the user, supplies the guesses.
+    :param console: an object with input and print functions to play through; by default, the terminal.
     :return: None.
     """
     start_condition: bool = False
     seek_value: int = 0
     while not start_condition:
-        sv_input_string: str = input("Please give the seek value: ").strip()
+        sv_input_string: str = console.input("Please give the seek value: ").strip()
         if not sv_input_string.isdigit():
-            print("The given value to be sought is invalid. Please try again.")
+            console.print("The given value to be sought is invalid. Please try again.")
         else:
             seek_value = int(sv_input_string)
             start_condition = True
-            print("Let the game begin!")
+            console.print("Let the game begin!")
     else:
+        guesser = None
+        if auto_play:
+            guesser = bisection_guesser()
+            next(guesser)
+        feedback: int = 0
         win_condition: bool = False
         while not win_condition:
-            guessed_value = input("Please supply a new guess: ").strip()
+            if guesser is not None:
+                guessed_value = str(guesser.send(feedback))
+                console.print("The solver guesses: " + guessed_value)
+            else:
+                guessed_value = console.input("Please supply a new guess: ").strip()
             if not guessed_value.isdigit():
-                print("Invalid input. Try again.")
+                console.print("Invalid input. Try again.")
             else:
                 guessed_value = int(guessed_value)
-                if guessed_value == seek_value:
-                    print("That input is correct!")
+                feedback = compare_guess(guessed_value, seek_value)
+                if feedback == 0:
+                    console.print("That input is correct!")
                     win_condition = True
                 else:
-                    if guessed_value > seek_value:
-                        print("That input is above the value sought.")
+                    if feedback > 0:
+                        console.print("That input is above the value sought.")
                     else:
-                        print("That input is below the value sought.")
-        print("Congratulations! You won!")
+                        console.print("That input is below the value sought.")
+        console.print("Congratulations! You won!")
 
 
-def unknown_hc() -> None:
+def unknown_hc(auto_play: bool = False, console=builtins) -> None:
     """
     This method executes the number-guessing game in which the seek value is unknown.
     Instead, the user may supply the upper limit for teh range of seek values.
+    :param auto_play: a bool as to whether the solver, rather than the user, supplies the guesses.
+    :param console: an object with input and print functions to play through; by default, the terminal.
     :return: None.
     """
     upper_value: int = 0
     while not upper_value:
-        uv_input_string = input("Please supply an upper limit for the game: ").strip()
+        uv_input_string = console.input("Please supply an upper limit for the game: ").strip()
         if not uv_input_string.isdigit():
-            print("The given upper limit for the game is invalid. Please try again.")
+            console.print("The given upper limit for the game is invalid. Please try again.")
         elif uv_input_string.isdigit() and int(uv_input_string) == 0:
-            print("The given upper limit is less than or equal to zero. Please choose a higher limit.")
+            console.print("The given upper limit is less than or equal to zero. Please choose a higher limit.")
         else:
             upper_value = int(uv_input_string)
-            print("Let the game begin!")
+            console.print("Let the game begin!")
     else:
         seek_value: int = random.randint(0, upper_value)
+        guesser = None
+        if auto_play:
+            guesser = bisection_guesser(upper_value)
+            next(guesser)
+        feedback: int = 0
         win_condition: bool = False
         while not win_condition:
-            guessed_value = input("Please supply a new guess: ").strip()
+            if guesser is not None:
+                guessed_value = str(guesser.send(feedback))
+                console.print("The solver guesses: " + guessed_value)
+            else:
+                guessed_value = console.input("Please supply a new guess: ").strip()
             if not guessed_value.isdigit():
-                print("Invalid input. Try again.")
+                console.print("Invalid input. Try again.")
             else:
                 guessed_value = int(guessed_value)
-                if guessed_value == seek_value:
-                    print("That input is correct!")
+                feedback = compare_guess(guessed_value, seek_value)
+                if feedback == 0:
+                    console.print("That input is correct!")
                     win_condition = True
                 else:
-                    if guessed_value > seek_value:
+                    if feedback > 0:
                         if guessed_value <= upper_value:
-                            print("That input is above the value sought.")
+                            console.print("That input is above the value sought.")
                         else:
-                            print("That input is above the upper limit of the values searched.")
+                            console.print("That input is above the upper limit of the values searched.")
                     else:
                         if guessed_value >= 0:
-                            print("That input is below the value sought.")
+                            console.print("That input is below the value sought.")
                         else:
-                            print("That input is below the lower limit of the values searched.")
-        print("Congratulations! You won!")
+                            console.print("That input is below the lower limit of the values searched.")
+        console.print("Congratulations! You won!")
+
+
+def compare_guess(guessed_value: int, seek_value: int) -> int:
+    """
+    This method determines how a guess relates to the value sought.
+    :param guessed_value: the integer guessed.
+    :param seek_value: the integer being sought.
+    :return: 0 if the guess is correct, 1 if it is above the value sought, and -1 if it is below it.
+    """
+    if guessed_value == seek_value:
+        return 0
+    elif guessed_value > seek_value:
+        return 1
+    else:
+        return -1
+
+
+def bisection_guesser(upper_value: int = None):
+    """
+    This method supplies guesses that halve the range of possible values each time.
+    It is a generator: after it is started, each result from compare_guess is sent to it,
+    and it answers with the next guess. If the upper limit is unknown, it doubles its guess
+    until it is above the value sought before halving.
+    :param upper_value: the largest possible value, or None if it is unknown.
+    :return: a generator of integer guesses.
+    """
+    low: int = 0
+    high: int = upper_value
+    yield None
+    if high is None:
+        guess: int = 1
+        while (yield guess) < 0:
+            low = guess + 1
+            guess *= 2
+        high = guess
+    while True:
+        guess = (low + high) // 2
+        feedback: int = yield guess
+        if feedback > 0:
+            high = guess - 1
+        elif feedback < 0:
+            low = guess + 1
 
 
-def introduction() -> None:
+def count_solver_guesses(seek_value: int, upper_value: int) -> int:
+    """
+    This method plays one game of the Unknown variant with the solver, without any input or output.
+    The guesses come from bisection_guesser, the same solver that plays known_hc and unknown_hc.
+    :param seek_value: the integer being sought, between 0 and upper_value.
+    :param upper_value: the largest possible value.
+    :return: the number of guesses needed to find the value sought.
+    """
+    guesser = bisection_guesser(upper_value)
+    next(guesser)
+    num_guesses: int = 1
+    feedback: int = compare_guess(guesser.send(0), seek_value)
+    while feedback != 0:
+        feedback = compare_guess(guesser.send(feedback), seek_value)
+        num_guesses += 1
+    return num_guesses
+
+
+def evaluate_solver(num_games: int, upper_value: int, seed: int = 0) -> dict:
+    """
+    This method plays many games of the Unknown variant with the solver and summarizes how many guesses it needs.
+    Halving the range of [0, upper_value] should never need more than ceil(log2(upper_value + 2)) guesses,
+    which is the bit length of upper_value + 1; this works for integers of any size.
+    :param num_games: the number of games to play.
+    :param upper_value: the largest possible value.
+    :param seed: the seed from which the values sought are generated.
+    :return: a dictionary with the number of games, the distribution and the mean and largest number of guesses,
+    the bound on the number of guesses, and whether every game kept within it.
+    """
+    seek_generator: random.Random = random.Random(seed)
+    guess_counts: collections.Counter = collections.Counter(
+        count_solver_guesses(seek_generator.randint(0, upper_value), upper_value) for _ in range(num_games))
+    bound: int = (upper_value + 1).bit_length()
+    max_guesses: int = max(guess_counts, default=0)
+    return {"games": num_games,
+            "guess_counts": dict(sorted(guess_counts.items())),
+            "mean_guesses": sum(count * games for count, games in guess_counts.items()) / num_games
+            if num_games else 0.0,
+            "max_guesses": max_guesses,
+            "bound": bound,
+            "within_bound": max_guesses <= bound}
+
+
+def introduction(console=builtins) -> None:
     """
     This method displays the introduction for the number-guessing game's menu.
+    :param console: an object with input and print functions to play through; by default, the terminal.
     :return: None.
     """
-    print("Welcome to the Number-Guess Menu.")
-    print("There are two variants available for the Number Guessing Game.")
-    print("The Known variant requires you to supply a number that is the answer at the beginning.")
-    print("It is useful for testing purposes.")
-    print("The Unknown variant requires you to supply an upper limit and randomly chooses a value to be sought.")
-    help_message()
+    console.print("Welcome to the Number-Guess Menu.")
+    console.print("There are two variants available for the Number Guessing Game.")
+    console.print("The Known variant requires you to supply a number that is the answer at the beginning.")
+    console.print("It is useful for testing purposes.")
+    console.print("The Unknown variant requires you to supply an upper limit and randomly chooses a value to be sought.")
+    help_message(console)
 
 
-def help_message() -> None:
+def help_message(console=builtins) -> None:
     """
     This method displays a help message for the player so that they know what commands are available.
+    :param console: an object with input and print functions to play through; by default, the terminal.
     :return: None.
     """
-    print("To select a game, please type Known or Unknown. To quit, type Quit.")
-    print("To repeat your options, type Help.")
+    console.print("To select a game, please type Known or Unknown. To quit, type Quit.")
+    console.print("To have the solver play a game, type Known Auto or Unknown Auto.")
+    console.print("To repeat your options, type Help.")
 
 
-def main_menu() -> None:
+def main_menu(console=builtins) -> None:
     """
     This method runs the main menu as the user needs it.
     It allows access to both of the number-guessing games, the help message, and the ability to
     end the program with the commands "known", "unknown", "help", and "quit", respectively.
+    The commands "known auto" and "unknown auto" have the solver play either game.
+    :param console: an object with input and print functions to play through; by default, the terminal.
     :return: None.
     """
     game_condition: bool = True
     while game_condition:
-        introduction()
+        introduction(console)
         input_condition: bool = False
         while not input_condition:
-            print("")
-            new_input: str = input(">> ").lower().strip()
+            console.print("")
+            new_input: str = console.input(">> ").lower().strip()
             if new_input == "known":
-                known_hc()
+                known_hc(console=console)
                 input_condition = True
             elif new_input == "unknown":
-                unknown_hc()
+                unknown_hc(console=console)
+                input_condition = True
+            elif new_input == "known auto":
+                known_hc(auto_play=True, console=console)
+                input_condition = True
+            elif new_input == "unknown auto":
+                unknown_hc(auto_play=True, console=console)
                 input_condition = True
             elif new_input == "help":
-                help_message()
+                help_message(console)
             elif new_input == "quit":
                 input_condition = True
                 game_condition = False
-                print("Goodbye!")
+                console.print("Goodbye!")
             else:
-                print("That input was not recognized. Please try again.")
+                console.print("That input was not recognized. Please try again.")
         else:
             if game_condition:
-                print("")
-                print("-----------------------------------------------------------------------------------------")
-                print("You are back on the main menu.")
+                console.print("")
+                console.print("-----------------------------------------------------------------------------------------")
+                console.print("You are back on the main menu.")
 
 
-main_menu()
+if __name__ == "__main__":
+    main_menu()
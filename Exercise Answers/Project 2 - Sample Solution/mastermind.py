@@ -1,8 +1,12 @@
 """
 The following composes a game of Mastermind in an enumeration (MMColor) and a class (Mastermind).
 Currently, the game automatically runs upon the creation of a Mastermind object.
+The rules and state of each game are kept in a MastermindEngine, which performs no input or output
+and so can also be driven directly by a program.
 As of this time, the Mastermind game allows for customization in the number of colors, code slots,
 and rounds that the game can have.
+Beside the game, a table of precomputed results (FeedbackTable) supports an automated codebreaker
+(MastermindSolver) that follows Knuth's minimax method.
 
 This is used as a project in Pythonic Pursuits. The following is a sample solution.
 Of the below classes, MMColor will likely be given to students for their use as they please.
@@ -12,9 +16,16 @@ besides __init__. However, the code is expected to have some knowledge in the fo
 lists, complex conditionals, types of iteration, membership, importing libraries, and classes.
 """
 
+import builtins
 import time
 import random
 import copy
+import operator
+import collections
+import concurrent.futures
+import mmap
+import os
+import tempfile
 from aenum import Enum
 
 
@@ -53,22 +64,540 @@ class MMColor(Enum, init='value full_name'):
         return self.full_name + " (" + self.name + ")"
 
 
+class MMCode:
+    """
+    This class packs a code of MMColors into a single integer, reading their values, less one,
+    as the digits of a number in base num_colors (the first slot being the most significant).
+    Codes are numbered in the same way as in FeedbackTable, so a code's index is also its place in the table.
+    Packed codes are cheaper to store, compare, and hash than lists of MMColors.
+    """
+    __slots__ = ("index", "num_code_slots", "num_colors")
+    DIGITS: dict = {color.name: color.value - 1 for color in MMColor}
+
+    def __init__(self, index: int, num_code_slots: int, num_colors: int) -> None:
+        """
+        This method records a packed code.
+        :param index: an integer between 0 and num_colors ** num_code_slots - 1.
+        :param num_code_slots: an integer dictating how many slots there are in the code.
+        :param num_colors: an integer declaring the number of colors that can be used in the code.
+        """
+        self.index: int = index
+        self.num_code_slots: int = num_code_slots
+        self.num_colors: int = num_colors
+
+    @classmethod
+    def from_values(cls, values, num_colors: int):
+        """
+        This method packs a code given by the values of its MMColors.
+        :param values: a sequence of MMColor values (e.g. a list, bytes, or array('B')).
+        :param num_colors: an integer declaring the number of colors that can be used in the code.
+        :return: an MMCode.
+        """
+        index: int = 0
+        for value in values:
+            index = index * num_colors + value - 1
+        return cls(index, len(values), num_colors)
+
+    @classmethod
+    def from_colors(cls, colors: list, num_colors: int):
+        """
+        This method packs a code given as a list of MMColors.
+        :param colors: a list of MMColors.
+        :param num_colors: an integer declaring the number of colors that can be used in the code.
+        :return: an MMCode.
+        """
+        return cls.from_values([color.value for color in colors], num_colors)
+
+    @classmethod
+    def from_input(cls, mm_input: str, num_code_slots: int, num_colors: int):
+        """
+        This method packs a code given in the form that the player types, as for Mastermind.convert_input.
+        :param mm_input: a string of color abbreviations, optionally separated by spaces.
+        :param num_code_slots: an integer dictating how many slots there are in the code.
+        :param num_colors: an integer declaring the number of colors that can be used in the code.
+        :return: an MMCode, or None if the input is not a valid code.
+        """
+        mm_input = mm_input.strip().upper().replace(' ', '')
+        if len(mm_input) != num_code_slots:
+            return None
+        index: int = 0
+        for char in mm_input:
+            digit: int = cls.DIGITS.get(char, num_colors)
+            if digit >= num_colors:
+                return None
+            index = index * num_colors + digit
+        return cls(index, num_code_slots, num_colors)
+
+    def to_values(self) -> bytes:
+        """
+        This method unpacks the code into the values of its MMColors.
+        :return: a bytes object with one MMColor value per slot.
+        """
+        values: bytearray = bytearray(self.num_code_slots)
+        index: int = self.index
+        for slot in range(self.num_code_slots - 1, -1, -1):
+            index, digit = divmod(index, self.num_colors)
+            values[slot] = digit + 1
+        return bytes(values)
+
+    def to_colors(self) -> list:
+        """
+        This method unpacks the code into a list of MMColors.
+        :return: a list of MMColors.
+        """
+        return [MMColor(value) for value in self.to_values()]
+
+    def to_input(self) -> str:
+        """
+        This method unpacks the code into the form that the player types.
+        :return: a string of color abbreviations.
+        """
+        return "".join(MMColor(value).name for value in self.to_values())
+
+    def analyze(self, solution) -> list:
+        """
+        This method scores this code as a guess against a solution, as does MastermindEngine.analyze_combination.
+        :param solution: an MMCode with the same number of slots.
+        :return: a list of two integers, the number correct and the number in the wrong place.
+        """
+        guess_values: bytes = self.to_values()
+        solution_values: bytes = solution.to_values()
+        num_correct: int = sum(map(operator.eq, guess_values, solution_values))
+        num_common: int = sum(min(guess_values.count(value), solution_values.count(value))
+                              for value in set(guess_values))
+        return [num_correct, num_common - num_correct]
+
+    def __eq__(self, other) -> bool:
+        """
+        This method determines whether two packed codes are the same.
+        :param other: another object.
+        :return: a bool as to whether the codes are equal.
+        """
+        if not isinstance(other, MMCode):
+            return NotImplemented
+        return (self.index == other.index and self.num_code_slots == other.num_code_slots
+                and self.num_colors == other.num_colors)
+
+    def __hash__(self) -> int:
+        """
+        This method hashes a packed code consistently with __eq__.
+        :return: int
+        """
+        return hash((self.index, self.num_code_slots, self.num_colors))
+
+    def __index__(self) -> int:
+        """
+        This method allows a packed code to be used wherever its number is expected.
+        :return: int
+        """
+        return self.index
+
+    def __str__(self) -> str:
+        """
+        This method, like __repr__, retrieves a printable version of a packed code in the form of a list of MMColors.
+        :return: str
+        """
+        return str(self.to_colors())
+
+    def __repr__(self) -> str:
+        """
+        This method, like __str__, retrieves a printable version of a packed code in the form of a list of MMColors.
+        :return: str
+        """
+        return str(self.to_colors())
+
+
+class FeedbackCache:
+    """
+    This class remembers the results of scoring guesses against solutions, keyed by a single integer
+    packing the guess and the solution (see MastermindEngine.pack_key).
+    It holds at most maxsize results; when it is full, the result used least recently is evicted.
+    It counts its hits, misses, and evictions so that its usefulness can be checked.
+    """
+    def __init__(self, maxsize: int = 65536) -> None:
+        """
+        This method sets up an empty cache.
+        :param maxsize: an integer noting how many results the cache can hold.
+        """
+        if maxsize <= 0:
+            raise ValueError("The cache must be able to hold at least one result.")
+        self.maxsize: int = maxsize
+        self.results: collections.OrderedDict = collections.OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def get(self, key: int):
+        """
+        This method retrieves a remembered result and marks it as recently used.
+        :param key: an integer packing the guess and the solution.
+        :return: the result, or None if it is not remembered.
+        """
+        result = self.results.get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.results.move_to_end(key)
+        return result
+
+    def put(self, key: int, result: tuple) -> None:
+        """
+        This method remembers a result, evicting the least recently used one if the cache is full.
+        :param key: an integer packing the guess and the solution.
+        :param result: a tuple of two integers, the number correct and the number in the wrong place.
+        :return: None.
+        """
+        self.results[key] = result
+        self.results.move_to_end(key)
+        if len(self.results) > self.maxsize:
+            self.results.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        This method forgets every result and resets the counters.
+        :return: None.
+        """
+        self.results.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        This method summarizes the use of the cache.
+        :return: a dictionary with the numbers of hits, misses, evictions, and results held, and the hit rate.
+        """
+        lookups: int = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self.results), "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def __len__(self) -> int:
+        """
+        This method counts the results held.
+        :return: int
+        """
+        return len(self.results)
+
+
+# EQUALS_TABLES[value] translates each byte to 1 if it equals value and to 0 otherwise;
+# MINIMUM_TABLES[count] caps each byte at count. Both are indexed up to the largest MMColor value.
+EQUALS_TABLES: list = [bytes(int(byte == value) for byte in range(256)) for value in range(len(MMColor.__members__) + 1)]
+MINIMUM_TABLES: list = [bytes(min(byte, count) for byte in range(256)) for count in range(len(MMColor.__members__) + 1)]
+
+
+class MastermindEngine:
+    """
+    This class holds the state of a game of Mastermind and its rules, without any input, output, or pauses.
+    It can thus be played by a program as quickly as the rules can be computed.
+    """
+    KEY_DIGIT_BITS: int = len(MMColor.__members__).bit_length()
+
+    def __init__(self, feedback_cache: FeedbackCache = None, seed=None) -> None:
+        """
+        This method establishes the items necessary for a game:
+        the solution to the game, the storage for past entries and results,
+        and the settings and progress of the game.
+        :param feedback_cache: an optional FeedbackCache for analyze_combination, which may be shared among engines.
+        :param seed: an optional seed for the solutions of all games not given their own seed.
+        """
+        self.feedback_cache: FeedbackCache = feedback_cache
+        self.solution: list = []
+        self.solution_key: int = 0
+        self.key_shift: int = 0
+        self.memory: list = []
+        self.num_rounds: int = 0
+        self.rounds_left: int = 0
+        self.num_code_slots: int = 0
+        self.num_colors: int = 0
+        self.won: bool = False
+        self.random: random.Random = random.Random(seed)
+        self.feedback_rows: FeedbackTable = None
+        self.candidate_mask: bytes = b""
+        self.num_candidates: int = 0
+        self.unapplied_results: list = []
+
+    def new_game(self, rounds: int, slots: int, colors: int, seed=None) -> None:
+        """
+        This method clears the previous game and generates the solution for a new one.
+        :param rounds: an integer noting how many rounds that the game will go on for.
+        :param slots: an integer dictating how many slots there are to fill in the Mastermind game.
+        :param colors: an integer declaring the number of colors that will be used in the Mastermind game.
+        :param seed: an optional seed for the random generation of the solution, so that it can be repeated;
+        without one, the solution continues the engine's random sequence.
+        :return: None.
+        """
+        if rounds <= 0 or not 0 < slots <= colors <= len(MMColor.__members__):
+            raise ValueError("The number of rounds, code slots, and colors must be usable in a game of Mastermind.")
+        self.solution.clear()
+        self.memory.clear()
+        self.num_rounds = rounds
+        self.rounds_left = rounds
+        self.num_code_slots = slots
+        self.num_colors = colors
+        self.won = False
+        if seed is not None:
+            self.random.seed(seed)
+        self.candidate_mask = b""
+        self.num_candidates = colors ** slots
+        self.unapplied_results.clear()
+        solution_gen_index: int = slots
+        while solution_gen_index > 0:
+            self.solution.append(MMColor(self.random.randint(1, colors)))
+            solution_gen_index -= 1
+        self.solution_key = self.pack_key(self.solution)
+        self.key_shift = self.KEY_DIGIT_BITS * slots + 1
+
+    @classmethod
+    def pack_key(cls, code: list) -> int:
+        """
+        This method packs a code into an integer for use in a FeedbackCache key: a leading 1 bit,
+        then each MMColor value in KEY_DIGIT_BITS bits. Plain integers are hashed in C,
+        unlike MMCodes or MMColors, so a cache lookup costs less than scoring the guess.
+        :param code: a list of MMColors.
+        :return: an integer of KEY_DIGIT_BITS * len(code) + 1 bits.
+        """
+        key: int = 1
+        for color in code:
+            key = (key << cls.KEY_DIGIT_BITS) | color._value_
+        return key
+
+    def is_over(self) -> bool:
+        """
+        This method determines whether the current game has ended, either in victory or in running out of rounds.
+        :return: a bool as to whether the game is over.
+        """
+        return self.won or self.rounds_left <= 0
+
+    def submit(self, guess: list) -> list:
+        """
+        This method plays one round of the game.
+        A correct guess wins the game; any other guess is stored in the memory and uses up a round.
+        A packed guess is kept packed in the memory.
+        :param guess: a list of MMColors (or of their values) with one entry per code slot, or an MMCode.
+        :return: a list of two integers in the same form as the result of analyze_combination.
+        """
+        if self.is_over():
+            raise ValueError("The game is over. Start a new game to keep playing.")
+        entry = guess
+        if isinstance(guess, MMCode):
+            if guess.num_colors != self.num_colors:
+                raise ValueError("The guess does not fit the code slots and colors of this game.")
+            guess = guess.to_colors()
+        guess = [color if isinstance(color, MMColor) else MMColor(color) for color in guess]
+        if len(guess) != self.num_code_slots or any(color.value > self.num_colors for color in guess):
+            raise ValueError("The guess does not fit the code slots and colors of this game.")
+        if not isinstance(entry, MMCode):
+            entry = guess
+        analysis: list = self.analyze_combination(guess)
+        self.unapplied_results.append((entry if isinstance(entry, MMCode) else
+                                       MMCode.from_colors(guess, self.num_colors), analysis))
+        if analysis[0] == self.num_code_slots:
+            self.won = True
+        else:
+            self.memory.append([entry, analysis])
+            self.rounds_left -= 1
+        return analysis
+
+    def update_candidates(self) -> None:
+        """
+        This method narrows down the codes that are consistent with every result so far.
+        The codes are kept as a mask with one byte (0 or 1) per code, numbered as in MMCode.
+        Only the results submitted since the last update are applied: for each, the guess is scored
+        against every code at once, the codes with the same result are marked, and the two masks
+        are combined as large integers.
+        :return: None.
+        """
+        if not self.unapplied_results:
+            return
+        if self.feedback_rows is None or (self.feedback_rows.num_code_slots, self.feedback_rows.num_colors) != \
+                (self.num_code_slots, self.num_colors):
+            self.feedback_rows = FeedbackTable(self.num_code_slots, self.num_colors, build=False)
+        num_codes: int = self.feedback_rows.num_codes
+        packed_mask: int = int.from_bytes(self.candidate_mask, "big") if self.candidate_mask else -1
+        for guess, analysis in self.unapplied_results:
+            feedback: int = self.feedback_rows.encode(analysis)
+            matches: bytes = self.feedback_rows.row(guess).translate(
+                bytes(1 if value == feedback else 0 for value in range(256)))
+            packed_mask &= int.from_bytes(matches, "big")
+        self.unapplied_results.clear()
+        self.candidate_mask = packed_mask.to_bytes(num_codes, "big")
+        self.num_candidates = self.candidate_mask.count(1)
+
+    def count_candidates(self) -> int:
+        """
+        This method counts the codes that are consistent with every result in the current game.
+        :return: an integer.
+        """
+        self.update_candidates()
+        return self.num_candidates
+
+    def candidate_codes(self):
+        """
+        This method lists the codes that are consistent with every result in the current game.
+        :return: an iterator of MMCodes.
+        """
+        self.update_candidates()
+        if not self.candidate_mask:
+            return (MMCode(index, self.num_code_slots, self.num_colors) for index in range(self.num_candidates))
+        return (MMCode(index, self.num_code_slots, self.num_colors)
+                for index, is_candidate in enumerate(self.candidate_mask) if is_candidate)
+
+    def analyze_combination(self, current_guess: list) -> list:
+        """
+        This method determines how many items in an attempted solution are in the right place
+        and how many are in the wrong place.
+        :param current_guess: a list of MMColors representing the player's present guess.
+        :return: a list of two integers. The first indicates the number of colors that the player
+        had in the correct location; the second indicates the number of colors that the player
+        had in the incorrect location.
+        """
+        if self.feedback_cache is not None:
+            cache_key: int = (self.solution_key << self.key_shift) | self.pack_key(current_guess)
+            cached_result = self.feedback_cache.get(cache_key)
+            if cached_result is not None:
+                return list(cached_result)
+
+        num_correct: int = 0
+        num_wrong_place: int = 0
+        temp_solution: list = copy.deepcopy(self.solution)
+        wrong_place_candidates = []
+        for index, color in enumerate(current_guess):
+            if color == self.solution[index]:
+                num_correct += 1
+                temp_solution[index] = True
+            elif color in temp_solution:
+                wrong_place_candidates.append(color)
+
+        for index, color in enumerate(wrong_place_candidates):
+            if color in temp_solution:
+                for i, item in enumerate(temp_solution):
+                    if color == item:
+                        temp_solution[i] = True
+                        break
+                num_wrong_place += 1
+        if self.feedback_cache is not None:
+            self.feedback_cache.put(cache_key, (num_correct, num_wrong_place))
+        return [num_correct, num_wrong_place]
+
+    @staticmethod
+    def analyze_batch(guesses, solutions):
+        """
+        This method scores many guesses against many solutions at once, with the same results as analyze_combination.
+        The number correct is the count of positional matches; the number of colors in common is the sum
+        of the per-color minimums of the two codes' color counts; the number in the wrong place is the difference.
+        NumPy arrays (recognized by their __array_ufunc__, so that NumPy is only imported when one is passed)
+        are scored as whole arrays. Anything else is scored a guess at a time against every solution at once,
+        as in FeedbackTable.compute_row (see analyze_batch_rows).
+        :param guesses: N codes, each a sequence of MMColor values (integers) of the same length;
+        a list of them or an N by slots NumPy array.
+        :param solutions: M codes in the same form as the guesses.
+        :return: for NumPy input, an N by M by 2 array of the numbers correct and in the wrong place;
+        otherwise, an N by M list of lists, each entry being a list of two integers as from analyze_combination.
+        """
+        if hasattr(guesses, "__array_ufunc__") or hasattr(solutions, "__array_ufunc__"):
+            import numpy
+            guess_array = numpy.asarray(guesses)
+            solution_array = numpy.asarray(solutions)
+            values = numpy.arange(1, len(MMColor.__members__) + 1)
+            guess_counts = (guess_array[:, :, None] == values).sum(1, dtype=numpy.uint8)
+            solution_counts = (solution_array[:, :, None] == values).sum(1, dtype=numpy.uint8)
+            # One N by M pass per color and per slot keeps memory to N by M bytes rather than N by M by colors.
+            num_common = numpy.zeros((len(guess_array), len(solution_array)), dtype=numpy.uint8)
+            for value_index in range(len(values)):
+                num_common += numpy.minimum(guess_counts[:, value_index, None], solution_counts[None, :, value_index])
+            num_correct = numpy.zeros_like(num_common)
+            for slot in range(guess_array.shape[1]):
+                num_correct += guess_array[:, slot, None] == solution_array[None, :, slot]
+            return numpy.stack([num_correct, num_common - num_correct], axis=-1)
+        return [list(map(list, zip(correct_row, wrong_place_row)))
+                for correct_row, wrong_place_row in MastermindEngine.analyze_batch_rows(guesses, solutions)]
+
+    @staticmethod
+    def analyze_batch_rows(guesses, solutions):
+        """
+        This method scores each guess against every solution at once, as byte rows.
+        The solutions are laid out as one row of bytes per code slot, holding that slot's value in every solution.
+        Translating such a row marks the solutions with a given value there, and rows of small counts are added
+        together as large integers (no count exceeds 255, so no byte carries into the next). The marked rows
+        for each slot and value, and the capped color-count rows for each color and count, are kept for reuse,
+        so each guess costs only a few large additions however many solutions there are.
+        :param guesses: an iterable of codes, each a sequence of MMColor values (integers).
+        :param solutions: a list of M codes, each a sequence of MMColor values (integers) of the same length.
+        :return: an iterator of pairs of bytes objects, one pair per guess, holding the number correct
+        and the number in the wrong place against each solution.
+        """
+        num_solutions: int = len(solutions)
+        if not num_solutions:
+            for _ in guesses:
+                yield b"", b""
+            return
+        slot_rows: list = [bytes(column) for column in zip(*solutions)]
+        match_rows: dict = {}
+        color_count_rows: dict = {}
+        capped_rows: dict = {}
+
+        def match_row(slot: int, value: int) -> int:
+            if (slot, value) not in match_rows:
+                match_rows[slot, value] = int.from_bytes(slot_rows[slot].translate(EQUALS_TABLES[value]), "big")
+            return match_rows[slot, value]
+
+        def capped_row(value: int, count: int) -> int:
+            if (value, count) not in capped_rows:
+                if value not in color_count_rows:
+                    color_count_rows[value] = sum(match_row(slot, value)
+                                                  for slot in range(len(slot_rows))).to_bytes(num_solutions, "big")
+                capped_rows[value, count] = int.from_bytes(
+                    color_count_rows[value].translate(MINIMUM_TABLES[count]), "big")
+            return capped_rows[value, count]
+
+        for guess in guesses:
+            guess = list(guess)
+            num_correct: int = sum(match_row(slot, value) for slot, value in enumerate(guess))
+            num_common: int = sum(capped_row(value, guess.count(value)) for value in set(guess))
+            yield (num_correct.to_bytes(num_solutions, "big"),
+                   (num_common - num_correct).to_bytes(num_solutions, "big"))
+
+
 class Mastermind:
     """
     This class composes the Mastermind game. It includes its own menu, instructions, and setup.
+    The rules and the state of each game are left to a MastermindEngine; this class handles the console.
     """
-    def __init__(self) -> None:
+    def __init__(self, seed=None, console=builtins, pause=time.sleep) -> None:
         """
         This method establishes and initiates items necessary for the Mastermind game:
-        the solution to each round of the game,
-        the storage for the user's actions during the game as a reference,
+        the engine that holds the solution to each round of the game
+        and the storage for the user's actions during the game as a reference,
+        the console through which the game is played,
         and the game's introduction and menu.
+        :param seed: an optional seed for the solutions, so that a session can be repeated.
+        :param console: an object with input and print functions to play through; by default, the terminal.
+        :param pause: a function that waits for a given number of seconds; by default, time.sleep.
         """
-        self.solution: list = []
-        self.memory: list = []
+        self.engine: MastermindEngine = MastermindEngine(seed=seed)
+        self.console = console
+        self.pause = pause
         self.general_introduction()
         self.main_menu()
 
+    @property
+    def solution(self) -> list:
+        """
+        This property retrieves the solution to the current game.
+        :return: a list of MMColors.
+        """
+        return self.engine.solution
+
+    @property
+    def memory(self) -> list:
+        """
+        This property retrieves the user's past entries and results in the current game.
+        :return: a list of [guess, result] pairs.
+        """
+        return self.engine.memory
+
     def main_menu(self) -> None:
         """
         This method initiates the game's main menu.
@@ -80,50 +609,48 @@ class Mastermind:
         """
         game_condition: bool = True
         while game_condition:
-            user_input: str = input(">> ").lower().strip()
+            user_input: str = self.console.input(">> ").lower().strip()
             if user_input == 'play':
-                num_rounds: str = input("Please give the number of rounds for the game: ")
+                num_rounds: str = self.console.input("Please give the number of rounds for the game: ")
                 if num_rounds.isdigit() and int(num_rounds) > 0:
                     num_rounds: int = int(num_rounds)
-                    num_code_slots: str = input("Please give the number of entries in the code: ")
+                    num_code_slots: str = self.console.input("Please give the number of entries in the code: ")
                     if num_code_slots.isdigit() and int(num_code_slots) > 0:
                         num_code_slots: int = int(num_code_slots)
-                        num_colors: str = input("Please give the number of colors used: ")
+                        num_colors: str = self.console.input("Please give the number of colors used: ")
                         if num_colors.isdigit() and num_code_slots <= int(num_colors) <= len(MMColor.__members__):
                             num_colors: int = int(num_colors)
                             self.initialize_mastermind(num_rounds, num_code_slots, num_colors)
                         else:
-                            print("That input is invalid. Please try again.")
-                            print("You have been returned to the main menu.")
+                            self.console.print("That input is invalid. Please try again.")
+                            self.console.print("You have been returned to the main menu.")
                     else:
-                        print("That input is invalid. Please try again.")
-                        print("You have been returned to the main menu.")
+                        self.console.print("That input is invalid. Please try again.")
+                        self.console.print("You have been returned to the main menu.")
                 else:
-                    print("That input is invalid. Please try again.")
-                    print("You have been returned to the main menu.")
+                    self.console.print("That input is invalid. Please try again.")
+                    self.console.print("You have been returned to the main menu.")
             elif user_input == 'help':
                 self.help_menu()
             elif user_input == 'quit':
-                print("Goodbye!")
+                self.console.print("Goodbye!")
                 game_condition = False
             else:
-                print("Input not recognized. Please try again.")
-        time.sleep(3)
+                self.console.print("Input not recognized. Please try again.")
+        self.pause(3)
 
-    @staticmethod
-    def general_introduction():
+    def general_introduction(self):
         """
         This method displays the introduction to the Mastermind game.
         :return: None.
         """
-        print("Welcome to Mastermind! You are on the main menu.")
-        print("Type 'play' to start the game.")
-        print("Type 'help' to bring up the help menu, which will describe the game.")
-        print("Type 'quit' to leave this interface.")
-        print("")
+        self.console.print("Welcome to Mastermind! You are on the main menu.")
+        self.console.print("Type 'play' to start the game.")
+        self.console.print("Type 'help' to bring up the help menu, which will describe the game.")
+        self.console.print("Type 'quit' to leave this interface.")
+        self.console.print("")
 
-    @staticmethod
-    def help_menu():
+    def help_menu(self):
         """
         This method initiates the Mastermind game's help menu.
         It has the options of "mastermind", which gives a full explanation of the game,
@@ -132,135 +659,125 @@ class Mastermind:
         :return: None.
         """
         help_condition: bool = True
-        print("Would you like to hear about the game Mastermind or the game's commands?")
-        print("Type 'mastermind' for the former and 'commands' for the latter.")
-        print("Type 'back' to go back.")
+        self.console.print("Would you like to hear about the game Mastermind or the game's commands?")
+        self.console.print("Type 'mastermind' for the former and 'commands' for the latter.")
+        self.console.print("Type 'back' to go back.")
         while help_condition:
-            help_input: str = input(">> ").lower().strip()
+            help_input: str = self.console.input(">> ").lower().strip()
             if help_input in ["mastermind", "commands", "back"]:
                 if help_input == "mastermind":
-                    print("The game of Mastermind works as follows.")
-                    print("The goal of the game is for the player to determine a code.")
-                    print("This code is randomized by the game at its beginning.")
-                    print("In each round, the player guesses a code of a certain length.")
-                    print("The player does so by putting in a letter representing a color in the code,")
-                    print("supplying a space after that letter, and then another letter up until the last one.")
-                    input("Press enter to continue. (1/5)")
-                    print("Then, based on this input, the program determines two facts about the code.")
-                    print("First, it determines how many colors are present and in the right place.")
-                    print("Second, it determines how many colors are present but not in the right place.")
-                    print("It informs the user of how well his or her code does based on these criteria.")
-                    input("Press enter to continue. (2/5)")
-                    print("Then, the user can guess again. Depending on the user's initial inputs,")
-                    print("the user will have a set number of tries to get the code right.")
-                    print("The user will be able to see past results and inputs along the way.")
-                    print("If the user fails to get the code correct within a limited number of tries,")
-                    print("he or she loses. If the user gets the code exactly right, he or she wins.")
-                    input("Press enter to continue. (3/5)")
-                    print("The colors and their representations in this game are as follows.")
-                    print("Red is R. Blue is B. Yellow is Y. Green is G. Orange is O. Violet is V.")
-                    print("White is W. Black is K. Grey is E. Indigo is I. Pink is P. Brown is N.")
-                    print("The default setting for the game is ten rounds with six colors and four code slots.")
-                    print("The colors being used can be checked by typing 'colors' during the game.")
-                    input("Press enter to continue. (4/5)")
-                    print("Upon starting the game, you will be prompted to give three inputs.")
-                    print("First, you will be asked about the number of rounds you have to guess the correct input.")
-                    print("The minimum for this is one. Second, you will be asked about the number of code entries.")
-                    print("The minimum for this is also one. Third, you will be asked about the number colors.")
-                    print("The minimum for this is the number of code entries. The maximum is twelve.")
-                    input("Press enter to continue. (5/5)")
-                    print("")
+                    self.console.print("The game of Mastermind works as follows.")
+                    self.console.print("The goal of the game is for the player to determine a code.")
+                    self.console.print("This code is randomized by the game at its beginning.")
+                    self.console.print("In each round, the player guesses a code of a certain length.")
+                    self.console.print("The player does so by putting in a letter representing a color in the code,")
+                    self.console.print("supplying a space after that letter, and then another letter up until the last one.")
+                    self.console.input("Press enter to continue. (1/5)")
+                    self.console.print("Then, based on this input, the program determines two facts about the code.")
+                    self.console.print("First, it determines how many colors are present and in the right place.")
+                    self.console.print("Second, it determines how many colors are present but not in the right place.")
+                    self.console.print("It informs the user of how well his or her code does based on these criteria.")
+                    self.console.input("Press enter to continue. (2/5)")
+                    self.console.print("Then, the user can guess again. Depending on the user's initial inputs,")
+                    self.console.print("the user will have a set number of tries to get the code right.")
+                    self.console.print("The user will be able to see past results and inputs along the way.")
+                    self.console.print("If the user fails to get the code correct within a limited number of tries,")
+                    self.console.print("he or she loses. If the user gets the code exactly right, he or she wins.")
+                    self.console.input("Press enter to continue. (3/5)")
+                    self.console.print("The colors and their representations in this game are as follows.")
+                    self.console.print("Red is R. Blue is B. Yellow is Y. Green is G. Orange is O. Violet is V.")
+                    self.console.print("White is W. Black is K. Grey is E. Indigo is I. Pink is P. Brown is N.")
+                    self.console.print("The default setting for the game is ten rounds with six colors and four code slots.")
+                    self.console.print("The colors being used can be checked by typing 'colors' during the game.")
+                    self.console.input("Press enter to continue. (4/5)")
+                    self.console.print("Upon starting the game, you will be prompted to give three inputs.")
+                    self.console.print("First, you will be asked about the number of rounds you have to guess the correct input.")
+                    self.console.print("The minimum for this is one. Second, you will be asked about the number of code entries.")
+                    self.console.print("The minimum for this is also one. Third, you will be asked about the number colors.")
+                    self.console.print("The minimum for this is the number of code entries. The maximum is twelve.")
+                    self.console.input("Press enter to continue. (5/5)")
+                    self.console.print("")
                 elif help_input == "commands":
-                    print("On the main menu, commands are 'help', 'quit', and 'play'.")
-                    print("In the game, commands are 'colors' and 'memory'.")
-                    print("Under the 'help' command, the 'mastermind' and 'commands' commands are available.")
-                    print("")
+                    self.console.print("On the main menu, commands are 'help', 'quit', and 'play'.")
+                    self.console.print("In the game, commands are 'colors', 'memory', and 'candidates'.")
+                    self.console.print("Under the 'help' command, the 'mastermind' and 'commands' commands are available.")
+                    self.console.print("")
                 else:
                     help_condition = False
-                    input("Going back to the main menu... (Press enter to continue.)")
-                    time.sleep(3)
-                    print("You are now back on the main menu.")
-                    print("")
+                    self.console.input("Going back to the main menu... (Press enter to continue.)")
+                    self.pause(3)
+                    self.console.print("You are now back on the main menu.")
+                    self.console.print("")
             else:
-                print("That input was invalid. Please try again.")
+                self.console.print("That input was invalid. Please try again.")
 
     def initialize_mastermind(self, num_rounds: int, num_code_slots: int, num_colors: int) -> None:
         """
         This method begins the Mastermind game.
-        It assures that the solution and memory lists are clear.
+        It has the engine clear the solution and memory lists and generate a new solution.
         Then, it sets up the game according to the preferences dictated in the game's setup.
         :param num_rounds: an integer noting how many rounds that the game will go on for.
         :param num_code_slots: an integer dictating how many slots there are to fill in the Mastermind game.
         :param num_colors: an integer declaring the number of colors that will be used in the Mastermind game.
         :return: None.
         """
-        self.solution.clear()
-        self.memory.clear()
-        solution_gen_index: int = num_code_slots
-        while solution_gen_index > 0:
-            self.solution.append(MMColor(random.randint(1, num_colors)))
-            solution_gen_index -= 1
+        self.engine.new_game(num_rounds, num_code_slots, num_colors)
         self.game_introduction()
-        self.play_mastermind(num_rounds, num_code_slots, num_colors)
+        self.play_mastermind()
 
-    @staticmethod
-    def game_introduction() -> None:
+    def game_introduction(self) -> None:
         """
         This method plays the introduction to the game and reminds the user of its commands.
         :return: None.
         """
-        print("Welcome to Mastermind.")
-        print("The solution for this round has been generated. Let's begin, shall we?")
-        input("Press enter to continue.")
-        print("")
-        print("Enter answers as a sequence of four letters representing colors in the code.")
-        print("To remind yourself of what colors are available for use, type 'colors' here.")
-        print("To remind yourself of your past entries and results, type 'memory' here.")
+        self.console.print("Welcome to Mastermind.")
+        self.console.print("The solution for this round has been generated. Let's begin, shall we?")
+        self.console.input("Press enter to continue.")
+        self.console.print("")
+        self.console.print("Enter answers as a sequence of four letters representing colors in the code.")
+        self.console.print("To remind yourself of what colors are available for use, type 'colors' here.")
+        self.console.print("To remind yourself of your past entries and results, type 'memory' here.")
+        self.console.print("To see how many codes still fit your past entries and results, type 'candidates' here.")
 
-    def play_mastermind(self, num_rounds: int, num_code_slots: int, num_colors: int) -> None:
+    def play_mastermind(self) -> None:
         """
-        This method sets the Mastermind game in motion.
-        :param num_rounds: an integer noting how many rounds that the game will go on for.
-        :param num_code_slots: an integer dictating how many slots there are to fill in the Mastermind game.
-        :param num_colors: an integer declaring the number of colors that will be used in the Mastermind game.
+        This method sets the Mastermind game in motion, relaying the player's entries to the engine.
         :return: None.
         """
-        while num_rounds > 0:
-            if num_rounds == 1:
-                print("You have " + str(num_rounds) + " round left.")
+        while not self.engine.is_over():
+            if self.engine.rounds_left == 1:
+                self.console.print("You have " + str(self.engine.rounds_left) + " round left.")
             else:
-                print("You have " + str(num_rounds) + " rounds left.")
+                self.console.print("You have " + str(self.engine.rounds_left) + " rounds left.")
 
-            mm_input: str = input(">> ")
+            mm_input: str = self.console.input(">> ")
             if mm_input == "colors":
-                self.print_colors(num_colors)
+                self.print_colors(self.engine.num_colors)
             elif mm_input == "memory":
                 self.print_memory()
+            elif mm_input == "candidates":
+                self.print_candidates()
             else:
-                mm_input: list = self.convert_input(mm_input, num_code_slots, num_colors)
-                if self.is_valid_input(mm_input, num_code_slots):
-                    analysis: list = self.analyze_combination(mm_input)
-                    if analysis[0] == num_code_slots:
+                mm_input: list = self.convert_input(mm_input, self.engine.num_code_slots, self.engine.num_colors)
+                if self.is_valid_input(mm_input, self.engine.num_code_slots):
+                    analysis: list = self.engine.submit(mm_input)
+                    if self.engine.won:
                         self.victory_screen()
-                        break
                     else:
-                        self.memory.append([mm_input, analysis])
-                        print("That result was not correct.")
-                        print("Your input was: " + str(mm_input) + ".")
-                        print("The result was: " + str(analysis[0]) + " colors are correct and " +
+                        self.console.print("That result was not correct.")
+                        self.console.print("Your input was: " + str(mm_input) + ".")
+                        self.console.print("The result was: " + str(analysis[0]) + " colors are correct and " +
                               str(analysis[1]) + " are in the wrong place.")
-                        num_rounds -= 1
                 else:
-                    print("That input was invalid. Please try again.")
-        else:
-            print("Sorry, you're out of time. This game is over.")
-            print("The winning combination was: " + str(self.solution) + ".")
-            print("Redirecting you back to the main menu...")
-            time.sleep(3)
-            print("You are back on the main menu.")
+                    self.console.print("That input was invalid. Please try again.")
+        if not self.engine.won:
+            self.console.print("Sorry, you're out of time. This game is over.")
+            self.console.print("The winning combination was: " + str(self.solution) + ".")
+            self.console.print("Redirecting you back to the main menu...")
+            self.pause(3)
+            self.console.print("You are back on the main menu.")
 
-    @staticmethod
-    def print_colors(num_colors: int) -> None:
+    def print_colors(self, num_colors: int) -> None:
         """
 
         :param num_colors: an integer declaring the number of colors that are used in the Mastermind game.
@@ -268,7 +785,7 @@ class Mastermind:
         """
         color_index: int = 1
         while color_index <= num_colors:
-            print(MMColor(color_index))
+            self.console.print(MMColor(color_index))
             color_index += 1
 
     def print_memory(self) -> None:
@@ -277,11 +794,22 @@ class Mastermind:
         :return:
         """
         if len(self.memory) == 0:
-            print("There are no former entries to print.")
+            self.console.print("There are no former entries to print.")
         else:
-            print("Entry Format: Number of Entry. [Input Sequence]; [Number Correct, Number in Wrong Place]")
+            self.console.print("Entry Format: Number of Entry. [Input Sequence]; [Number Correct, Number in Wrong Place]")
             for index, prior_input in enumerate(self.memory):
-                print(str(index + 1) + ". " + str(prior_input[0]) + "; " + str(prior_input[1]))
+                self.console.print(str(index + 1) + ". " + str(prior_input[0]) + "; " + str(prior_input[1]))
+
+    def print_candidates(self) -> None:
+        """
+        This method displays how many codes are still consistent with the user's past entries and results.
+        :return: None.
+        """
+        num_candidates: int = self.engine.count_candidates()
+        if num_candidates == 1:
+            self.console.print("There is 1 code that fits your past entries and results.")
+        else:
+            self.console.print("There are " + str(num_candidates) + " codes that fit your past entries and results.")
 
     @staticmethod
     def convert_input(mm_input: str, num_code_slots: int, num_colors: int) -> list:
@@ -325,42 +853,393 @@ class Mastermind:
     def analyze_combination(self, current_guess: list) -> list:
         """
         This method determines how many items in an attempted solution are in the right place
-        and how many are in the wrong place.
+        and how many are in the wrong place. The work is done by MastermindEngine.analyze_combination.
         :param current_guess: a list of MMColors representing the player's present guess.
-        :return: a list of two integers. The first indicates the number of colors that the player
-        had in the correct location; the second indicates the number of colors that the player
-        had in the incorrect location.
+        :return: a list of two integers, as in MastermindEngine.analyze_combination.
         """
-        num_correct: int = 0
-        num_wrong_place: int = 0
-        temp_solution: list = copy.deepcopy(self.solution)
-        wrong_place_candidates = []
-        for index, color in enumerate(current_guess):
-            if color == self.solution[index]:
-                num_correct += 1
-                temp_solution[index] = True
-            elif color in temp_solution:
-                wrong_place_candidates.append(color)
+        return self.engine.analyze_combination(current_guess)
 
-        for index, color in enumerate(wrong_place_candidates):
-            if color in temp_solution:
-                for i, item in enumerate(temp_solution):
-                    if color == item:
-                        temp_solution[i] = True
-                        break
-                num_wrong_place += 1
-        return [num_correct, num_wrong_place]
-
-    @staticmethod
-    def victory_screen() -> None:
+    def victory_screen(self) -> None:
         """
         This method displays text upon winning Mastermind.
         :return: None.
         """
-        print("Congratulations! That was the correct combination! You won!")
-        print("Returning to the main menu...")
-        time.sleep(5)
-        print("You are back on the main menu.")
+        self.console.print("Congratulations! That was the correct combination! You won!")
+        self.console.print("Returning to the main menu...")
+        self.pause(5)
+        self.console.print("You are back on the main menu.")
+
+
+class FeedbackTable:
+    """
+    This class precomputes the result of scoring every possible code against every other possible code.
+    Codes are numbered from 0 to num_colors ** num_code_slots - 1 by reading their MMColor values,
+    less one, as the digits of a number in base num_colors (the first slot being the most significant).
+    Each result is stored in a single byte as (number correct) * (num_code_slots + 1) + (number in wrong place).
+    Small tables are kept in memory; larger ones are written to a file and memory-mapped.
+    """
+    IN_MEMORY_LIMIT: int = 64 * 1024 * 1024
+    INCREMENT: bytes = bytes((value + 1) % 256 for value in range(256))
+
+    def __init__(self, num_code_slots: int = 4, num_colors: int = 6, path: str = None, build: bool = True) -> None:
+        """
+        This method sets up the table for a given game configuration and builds it.
+        :param num_code_slots: an integer dictating how many slots there are to fill in the Mastermind game.
+        :param num_colors: an integer declaring the number of colors that are used in the Mastermind game.
+        :param path: an optional file path in which to store the table; if it is not given,
+        tables larger than IN_MEMORY_LIMIT are stored in a temporary file.
+        :param build: a bool as to whether to build the table; if not, rows are computed as they are needed.
+        This suits configurations whose tables would be too large to store.
+        """
+        if not 0 < num_code_slots <= num_colors <= len(MMColor.__members__):
+            raise ValueError("The number of code slots and colors must be usable in a game of Mastermind.")
+        self.num_code_slots: int = num_code_slots
+        self.num_colors: int = num_colors
+        self.num_codes: int = num_colors ** num_code_slots
+        self.solved_feedback: int = self.encode([num_code_slots, 0])
+        self.color_rows: list = [self.match_count_row([color] * num_code_slots) for color in range(num_colors)]
+        self.table = None
+        if build:
+            self.build(path)
+
+    def encode(self, analysis: list) -> int:
+        """
+        This method packs the result of analyze_combination into a single integer.
+        :param analysis: a list of two integers, the number correct and the number in the wrong place.
+        :return: an integer less than 256.
+        """
+        return analysis[0] * (self.num_code_slots + 1) + analysis[1]
+
+    def decode(self, feedback: int) -> list:
+        """
+        This method unpacks a result packed by encode.
+        :param feedback: an integer packed by encode.
+        :return: a list of two integers in the same form as the result of analyze_combination.
+        """
+        return list(divmod(feedback, self.num_code_slots + 1))
+
+    def code_index(self, code: list) -> int:
+        """
+        This method determines the number of a code.
+        :param code: a list of MMColors or of their values, or an MMCode.
+        :return: an integer between 0 and num_codes - 1.
+        """
+        if isinstance(code, MMCode):
+            return code.index
+        index: int = 0
+        for color in code:
+            if isinstance(color, MMColor):
+                color = color.value
+            index = index * self.num_colors + color - 1
+        return index
+
+    def code_colors(self, index: int) -> list:
+        """
+        This method determines the code with a given number.
+        :param index: an integer between 0 and num_codes - 1.
+        :return: a list of MMColors.
+        """
+        code: list = []
+        for _ in range(self.num_code_slots):
+            index, digit = divmod(index, self.num_colors)
+            code.append(MMColor(digit + 1))
+        code.reverse()
+        return code
+
+    def match_count_row(self, slot_digits: list) -> bytes:
+        """
+        This method counts, for every code at once, the slots in which it holds a given digit.
+        The row is built up from the last slot to the first: codes that share every slot but the first
+        form consecutive blocks, so each step concatenates num_colors copies of the previous row,
+        bumping the copy whose digit matches with a byte translation.
+        :param slot_digits: a list with the digit (MMColor value less one) to look for in each slot.
+        :return: a bytes object with one count per code.
+        """
+        row: bytes = b"\x00"
+        for digit in reversed(slot_digits):
+            incremented_row: bytes = row.translate(self.INCREMENT)
+            row = b"".join(incremented_row if color == digit else row for color in range(self.num_colors))
+        return row
+
+    def compute_row(self, guess_index: int) -> bytes:
+        """
+        This method scores one guess against every code without using the stored table.
+        The number correct comes from match_count_row. The number of colors in common is the sum,
+        over the guess's colors, of each code's count of that color capped at the guess's count of it.
+        Since no entry exceeds 255, rows are added together as large integers.
+        :param guess_index: the number of the guess.
+        :return: a bytes object with the packed result for each code.
+        """
+        guess_digits: list = [color.value - 1 for color in self.code_colors(guess_index)]
+        num_correct_row: bytes = self.match_count_row(guess_digits)
+        packed_total: int = int.from_bytes(num_correct_row.translate(
+            bytes((value * self.num_code_slots) % 256 for value in range(256))), "big")
+        for digit in set(guess_digits):
+            guess_count: int = guess_digits.count(digit)
+            capped_row: bytes = self.color_rows[digit].translate(bytes(min(value, guess_count) for value in range(256)))
+            packed_total += int.from_bytes(capped_row, "big")
+        return packed_total.to_bytes(self.num_codes, "big")
+
+    def build(self, path: str = None) -> None:
+        """
+        This method fills the table, one row per guess.
+        :param path: an optional file path in which to store the table.
+        :return: None.
+        """
+        table_size: int = self.num_codes * self.num_codes
+        if path is None and table_size <= self.IN_MEMORY_LIMIT:
+            table: bytearray = bytearray(table_size)
+            for guess_index in range(self.num_codes):
+                table[guess_index * self.num_codes:(guess_index + 1) * self.num_codes] = self.compute_row(guess_index)
+            self.table = table
+        else:
+            table_file = open(path, "w+b") if path is not None else tempfile.TemporaryFile()
+            with table_file:
+                for guess_index in range(self.num_codes):
+                    table_file.write(self.compute_row(guess_index))
+                table_file.flush()
+                self.table = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def row(self, guess_index: int) -> bytes:
+        """
+        This method retrieves the packed results of one guess against every code.
+        :param guess_index: the number of the guess, or its MMCode.
+        :return: a bytes object with the packed result for each code.
+        """
+        guess_index = operator.index(guess_index)
+        if self.table is None:
+            return self.compute_row(guess_index)
+        return self.table[guess_index * self.num_codes:(guess_index + 1) * self.num_codes]
+
+    def lookup(self, guess_index: int, solution_index: int) -> int:
+        """
+        This method retrieves the packed result of one guess against one solution.
+        If the table was not built, the guess's row is computed instead.
+        :param guess_index: the number of the guess, or its MMCode.
+        :param solution_index: the number of the solution, or its MMCode.
+        :return: an integer packed as by encode.
+        """
+        if self.table is None:
+            return self.compute_row(operator.index(guess_index))[operator.index(solution_index)]
+        return self.table[operator.index(guess_index) * self.num_codes + operator.index(solution_index)]
+
+
+class MastermindSolver:
+    """
+    This class plays the role of the codebreaker by Knuth's minimax method.
+    It keeps the codes that are consistent with every result so far; each guess is the code
+    that leaves the fewest of them in the worst case ("minimax") or on average ("expected").
+    Guesses are made from table lookups and are remembered, so later games repeat no work.
+    """
+    def __init__(self, num_code_slots: int = 4, num_colors: int = 6, strategy: str = "minimax",
+                 table: FeedbackTable = None) -> None:
+        """
+        This method sets up the solver.
+        :param num_code_slots: an integer dictating how many slots there are to fill in the Mastermind game.
+        :param num_colors: an integer declaring the number of colors that are used in the Mastermind game.
+        :param strategy: "minimax" to minimize the worst case or "expected" to minimize the expected case.
+        :param table: an optional FeedbackTable for the same configuration, which may be shared among solvers.
+        """
+        if strategy not in ["minimax", "expected"]:
+            raise ValueError("The strategy must be either 'minimax' or 'expected'.")
+        self.strategy: str = strategy
+        self.table: FeedbackTable = table if table is not None else FeedbackTable(num_code_slots, num_colors)
+        self.decisions: dict = {}
+
+    def partition_score(self, guess_index: int, candidates: list) -> int:
+        """
+        This method rates how well a guess splits the remaining candidates; lower is better.
+        :param guess_index: the number of the guess.
+        :param candidates: a list of the numbers of the codes still consistent with the results so far.
+        :return: the largest part for "minimax" or the sum of the squares of the parts for "expected".
+        """
+        part_sizes = collections.Counter(map(self.table.row(guess_index).__getitem__, candidates)).values()
+        if self.strategy == "minimax":
+            return max(part_sizes)
+        return sum(size * size for size in part_sizes)
+
+    def opening_guesses(self) -> list:
+        """
+        This method lists the first guesses worth considering.
+        Before any result is known, guesses that differ only by renaming colors or reordering slots
+        are equally good, so only the sorted codes that introduce colors in order are kept.
+        :return: a list of code numbers.
+        """
+        openings: list = []
+        for index in range(self.table.num_codes):
+            digits: list = [color.value - 1 for color in self.table.code_colors(index)]
+            if all(digits[i] == digits[i - 1] or digits[i] == digits[i - 1] + 1 for i in range(1, len(digits))) \
+                    and digits[0] == 0:
+                openings.append(index)
+        return openings
+
+    def choose_guess(self, candidates: list, history: tuple) -> int:
+        """
+        This method picks the next guess, preferring candidates and then lower code numbers in ties.
+        :param candidates: a list of the numbers of the codes still consistent with the results so far.
+        :param history: a tuple of (guess number, packed result) pairs made so far.
+        :return: the number of the next guess.
+        """
+        if history in self.decisions:
+            return self.decisions[history]
+        if len(candidates) <= 2:
+            guess_index: int = candidates[0]
+        else:
+            candidate_set: set = set(candidates)
+            possible_guesses = self.opening_guesses() if not history else range(self.table.num_codes)
+            guess_index = min(possible_guesses, key=lambda index: (self.partition_score(index, candidates),
+                                                                  index not in candidate_set, index))
+        self.decisions[history] = guess_index
+        return guess_index
+
+    def replay(self, memory: list) -> tuple:
+        """
+        This method narrows down the candidates according to a game's past entries.
+        :param memory: a list of [guess, result] pairs in the form of Mastermind.memory.
+        :return: a tuple of the remaining candidates and of the history of (guess number, packed result) pairs.
+        """
+        candidates: list = list(range(self.table.num_codes))
+        history: tuple = ()
+        for prior_guess, prior_analysis in memory:
+            guess_index: int = self.table.code_index(prior_guess)
+            feedback: int = self.table.encode(prior_analysis)
+            row: bytes = self.table.row(guess_index)
+            candidates = [index for index in candidates if row[index] == feedback]
+            history += ((guess_index, feedback),)
+        return candidates, history
+
+    def next_guess(self, memory: list) -> list:
+        """
+        This method suggests the next guess in a game in progress.
+        :param memory: a list of [guess, result] pairs in the form of Mastermind.memory.
+        :return: a list of MMColors.
+        """
+        return self.next_code(memory).to_colors()
+
+    def next_code(self, memory: list) -> MMCode:
+        """
+        This method suggests the next guess in a game in progress as a packed code.
+        :param memory: a list of [guess, result] pairs in the form of Mastermind.memory.
+        :return: an MMCode.
+        """
+        candidates, history = self.replay(memory)
+        if not candidates:
+            raise ValueError("No code is consistent with the given entries.")
+        return MMCode(self.choose_guess(candidates, history), self.table.num_code_slots, self.table.num_colors)
+
+    def solve(self, solution: list) -> list:
+        """
+        This method plays a whole game against a known solution.
+        :param solution: a list of MMColors or of their values, or an MMCode.
+        :return: a list of the guesses made, each a list of MMColors; the last one is the solution.
+        """
+        solution_index: int = self.table.code_index(solution)
+        candidates: list = list(range(self.table.num_codes))
+        history: tuple = ()
+        guesses: list = []
+        while True:
+            guess_index: int = self.choose_guess(candidates, history)
+            guesses.append(self.table.code_colors(guess_index))
+            feedback: int = self.table.lookup(guess_index, solution_index)
+            if feedback == self.table.solved_feedback:
+                return guesses
+            row: bytes = self.table.row(guess_index)
+            candidates = [index for index in candidates if row[index] == feedback]
+            history += ((guess_index, feedback),)
+
+
+class MastermindTournament:
+    """
+    This class plays a guessing strategy against many randomly generated solutions across several processes.
+    A strategy is a class that is created with the number of code slots and colors
+    and that has a next_guess method taking Mastermind.memory and returning a guess (as does MastermindSolver).
+    Each game is generated from its own seed, so a tournament over the same seeds always has the same results.
+    Strategies are kept in players so that each process sets up a strategy (e.g. its FeedbackTable) only once;
+    they must therefore choose their guesses the same way every time.
+    """
+    players: dict = {}
+
+    def __init__(self, strategy: type = MastermindSolver, num_rounds: int = 10, num_code_slots: int = 4,
+                 num_colors: int = 6, strategy_options: dict = None) -> None:
+        """
+        This method records the settings of the tournament.
+        :param strategy: the class of the strategy to be played.
+        :param num_rounds: an integer noting how many rounds that each game will go on for.
+        :param num_code_slots: an integer dictating how many slots there are to fill in each game.
+        :param num_colors: an integer declaring the number of colors that will be used in each game.
+        :param strategy_options: an optional dictionary of further arguments for the strategy.
+        """
+        self.strategy: type = strategy
+        self.num_rounds: int = num_rounds
+        self.num_code_slots: int = num_code_slots
+        self.num_colors: int = num_colors
+        self.strategy_options: dict = strategy_options if strategy_options is not None else {}
+
+    def run(self, seeds: range, max_workers: int = None, shard_size: int = None) -> dict:
+        """
+        This method plays one game per seed, splitting the seeds into ranges that are played in separate processes.
+        :param seeds: a range of integer seeds, one per game.
+        :param max_workers: an optional number of processes; by default, one per processor.
+        :param shard_size: an optional number of seeds per range; by default, about four ranges per process.
+        :return: a dictionary of results, as from merge_results.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if shard_size is None:
+            shard_size = max(1, -(-len(seeds) // (max_workers * 4)))
+        shards: list = [seeds[start:start + shard_size] for start in range(0, len(seeds), shard_size)]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            shard_results: list = list(executor.map(self.play_shard, shards))
+        return self.merge_results(shard_results)
+
+    def play_shard(self, seeds: range) -> dict:
+        """
+        This method plays one game per seed in the current process.
+        A game that is lost counts as having taken every round.
+        :param seeds: a range of integer seeds, one per game.
+        :return: a dictionary with the number of games and wins, the total and largest number of guesses,
+        and a Counter of how many games took each number of guesses.
+        """
+        engine: MastermindEngine = MastermindEngine()
+        player_key: tuple = (self.strategy, self.num_code_slots, self.num_colors,
+                             tuple(sorted(self.strategy_options.items())))
+        if player_key not in self.players:
+            self.players[player_key] = self.strategy(self.num_code_slots, self.num_colors, **self.strategy_options)
+        player = self.players[player_key]
+        results: dict = {"games": 0, "wins": 0, "total_guesses": 0, "max_guesses": 0,
+                         "guess_counts": collections.Counter()}
+        for seed in seeds:
+            engine.new_game(self.num_rounds, self.num_code_slots, self.num_colors, seed)
+            while not engine.is_over():
+                engine.submit(player.next_guess(engine.memory))
+            num_guesses: int = self.num_rounds - engine.rounds_left + engine.won
+            results["games"] += 1
+            results["wins"] += engine.won
+            results["total_guesses"] += num_guesses
+            results["max_guesses"] = max(results["max_guesses"], num_guesses)
+            results["guess_counts"][num_guesses] += 1
+        return results
+
+    @staticmethod
+    def merge_results(shard_results: list) -> dict:
+        """
+        This method combines the results of several shards and summarizes them.
+        :param shard_results: a list of dictionaries, as from play_shard.
+        :return: a dictionary with the number of games and wins, the win rate,
+        the mean and largest number of guesses, and a dictionary of how many games took each number of guesses.
+        """
+        games: int = sum(result["games"] for result in shard_results)
+        wins: int = sum(result["wins"] for result in shard_results)
+        total_guesses: int = sum(result["total_guesses"] for result in shard_results)
+        guess_counts: collections.Counter = sum((result["guess_counts"] for result in shard_results),
+                                                collections.Counter())
+        return {"games": games,
+                "wins": wins,
+                "win_rate": wins / games if games else 0.0,
+                "mean_guesses": total_guesses / games if games else 0.0,
+                "max_guesses": max((result["max_guesses"] for result in shard_results), default=0),
+                "guess_counts": dict(sorted(guess_counts.items()))}
 
 
-new_game: Mastermind = Mastermind()
+if __name__ == "__main__":
+    new_game: Mastermind = Mastermind()
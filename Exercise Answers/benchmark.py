@@ -0,0 +1,378 @@
+"""
+This program measures the speed of the hot paths in the sample solutions to the projects:
+scoring, converting, and validating guesses and generating solutions in Mastermind,
+and playing whole games of Mastermind and of both number-guessing games.
+It also compares the bulk versions of some exercise answers with calling the originals once per value.
+Every benchmark uses fixed seeds, and the games are fed scripted inputs in place of input(),
+so that two runs on the same machine do the same work (see scripted_console.py).
+Results (operations per second, and the peak and retained memory of a run, as traced by tracemalloc)
+are written to a JSON file. If a baseline file from an earlier run is given, any benchmark that has
+slowed down, or whose peak or retained memory has grown, by more than the allowed threshold is reported as a regression.
+
+Usage: python benchmark.py [--output results.json] [--baseline baseline.json] [--save-baseline baseline.json]
+"""
+
+import argparse
+import array
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from scripted_console import ScriptedConsole, load_module
+
+
+def bench_analyze_combination():
+    """
+    This function prepares a benchmark of MastermindEngine.analyze_combination.
+    :return: a tuple of a function to be timed and the number of operations that it performs.
+    """
+    mastermind = load_module("mastermind", "Project 2 - Sample Solution/mastermind.py")
+    engine = mastermind.MastermindEngine()
+    engine.new_game(10, 4, 6, seed=0)
+    rng: random.Random = random.Random(1)
+    guesses: list = [[mastermind.MMColor(rng.randint(1, 6)) for _ in range(4)] for _ in range(1000)]
+
+    def run() -> None:
+        for guess in guesses:
+            engine.analyze_combination(guess)
+    return run, len(guesses)
+
+
+def bench_convert_input():
+    """
+    This function prepares a benchmark of Mastermind.convert_input.
+    :return: a tuple of a function to be timed and the number of operations that it performs.
+    """
+    mastermind = load_module("mastermind", "Project 2 - Sample Solution/mastermind.py")
+    rng: random.Random = random.Random(2)
+    entries: list = [" ".join(rng.choice("RBYGOVX") for _ in range(4)) for _ in range(1000)]
+
+    def run() -> None:
+        for entry in entries:
+            mastermind.Mastermind.convert_input(entry, 4, 6)
+    return run, len(entries)
+
+
+def bench_is_valid_input():
+    """
+    This function prepares a benchmark of Mastermind.is_valid_input.
+    :return: a tuple of a function to be timed and the number of operations that it performs.
+    """
+    mastermind = load_module("mastermind", "Project 2 - Sample Solution/mastermind.py")
+    rng: random.Random = random.Random(3)
+    entries: list = [mastermind.Mastermind.convert_input("".join(rng.choice("RBYGOVX") for _ in range(4)), 4, 6)
+                     for _ in range(1000)]
+
+    def run() -> None:
+        for entry in entries:
+            mastermind.Mastermind.is_valid_input(entry, 4)
+    return run, len(entries)
+
+
+def bench_solution_generation():
+    """
+    This function prepares a benchmark of the generation of solutions for initialize_mastermind,
+    which is done by MastermindEngine.new_game.
+    :return: a tuple of a function to be timed and the number of operations that it performs.
+    """
+    mastermind = load_module("mastermind", "Project 2 - Sample Solution/mastermind.py")
+    engine = mastermind.MastermindEngine(seed=4)
+
+    def run() -> None:
+        for _ in range(1000):
+            engine.new_game(10, 4, 6)
+    return run, 1000
+
+
+def bench_mastermind_game():
+    """
+    This function prepares a benchmark of whole sessions of the Mastermind console game:
+    each plays ten rounds with fixed guesses, checks the colors and memory, and quits.
+    :return: a tuple of a function to be timed and the number of operations (games) that it performs.
+    """
+    mastermind = load_module("mastermind", "Project 2 - Sample Solution/mastermind.py")
+    session: list = ["play", "10", "4", "6", "", "colors"]
+    session += ["RRBB", "YYGG", "OOVV", "RBYG", "GYBR", "BOVR", "VORB", "YRGO", "memory", "GVYO", "ROYB"]
+    session += ["quit"]
+
+    def run() -> None:
+        for _ in range(20):
+            mastermind.Mastermind(seed=5, console=ScriptedConsole(session, echo=False), pause=ScriptedConsole.sleep)
+    return run, 20
+
+
+def bench_known_hc():
+    """
+    This function prepares a benchmark of whole games of known_hc, guessing by halves.
+    :return: a tuple of a function to be timed and the number of operations (games) that it performs.
+    """
+    number_guess_game = load_module("NumberGuessGame", "Project 1 - Sample Solution/NumberGuessGame.py")
+    rng: random.Random = random.Random(6)
+    scripts: list = []
+    for _ in range(100):
+        seek_value: int = rng.randint(0, 1000)
+        scripts.append([str(seek_value)] + bisection_script(seek_value, 1000))
+
+    def run() -> None:
+        for script in scripts:
+            number_guess_game.known_hc(console=ScriptedConsole(script, echo=False))
+    return run, len(scripts)
+
+
+def bench_unknown_hc():
+    """
+    This function prepares a benchmark of whole games of unknown_hc, guessing by halves.
+    The random module is reseeded before each game so that the value sought is known in advance.
+    :return: a tuple of a function to be timed and the number of operations (games) that it performs.
+    """
+    number_guess_game = load_module("NumberGuessGame", "Project 1 - Sample Solution/NumberGuessGame.py")
+    scripts: list = []
+    for seed in range(100):
+        random.seed(seed)
+        seek_value: int = random.randint(0, 1000)
+        scripts.append((seed, ["1000"] + bisection_script(seek_value, 1000)))
+
+    def run() -> None:
+        for seed, script in scripts:
+            random.seed(seed)
+            number_guess_game.unknown_hc(console=ScriptedConsole(script, echo=False))
+    return run, len(scripts)
+
+
+def bench_inch_to_cm():
+    """
+    This function prepares a benchmark of make_metric.inch_to_cm, called once per value.
+    :return: a tuple of a function to be timed and the number of operations (values) that it performs.
+    """
+    make_metric = load_module("make_metric", "Lecture 1 & Bridge 1 - Sample Answers/make_metric.py")
+    values: array.array = array.array("d", random.Random(7).choices(range(1000), k=100000))
+
+    def run() -> None:
+        for value in values:
+            make_metric.inch_to_cm(value)
+    return run, len(values)
+
+
+def bench_inches_to_cm():
+    """
+    This function prepares a benchmark of make_metric.inches_to_cm, writing into an existing array.
+    :return: a tuple of a function to be timed and the number of operations (values) that it performs.
+    """
+    make_metric = load_module("make_metric", "Lecture 1 & Bridge 1 - Sample Answers/make_metric.py")
+    values: array.array = array.array("d", random.Random(7).choices(range(1000), k=100000))
+    out: array.array = array.array("d", values)
+
+    def run() -> None:
+        make_metric.inches_to_cm(values, out)
+    return run, len(values)
+
+
+def bench_is_odd():
+    """
+    This function prepares a benchmark of oddity.is_odd, called once per value.
+    :return: a tuple of a function to be timed and the number of operations (values) that it performs.
+    """
+    oddity = load_module("oddity", "Lecture 1 & Bridge 1 - Sample Answers/oddity.py")
+    values: array.array = array.array("q", random.Random(8).choices(range(-10 ** 6, 10 ** 6), k=100000))
+
+    def run() -> None:
+        for value in values:
+            oddity.is_odd(value)
+    return run, len(values)
+
+
+def bench_odd_flags():
+    """
+    This function prepares a benchmark of oddity.odd_flags, writing into an existing bytearray.
+    :return: a tuple of a function to be timed and the number of operations (values) that it performs.
+    """
+    oddity = load_module("oddity", "Lecture 1 & Bridge 1 - Sample Answers/oddity.py")
+    values: array.array = array.array("q", random.Random(8).choices(range(-10 ** 6, 10 ** 6), k=100000))
+    out: bytearray = bytearray(len(values))
+
+    def run() -> None:
+        oddity.odd_flags(values, out)
+    return run, len(values)
+
+
+def bench_and():
+    """
+    This function prepares a benchmark of boolean_ops.AND, called once per pair of values.
+    :return: a tuple of a function to be timed and the number of operations (lanes) that it performs.
+    """
+    boolean_ops = load_module("boolean_ops", "Lecture 2 & Bridge 2 - Sample Answers/boolean_ops.py")
+    rng: random.Random = random.Random(9)
+    pairs: list = [(rng.random() < 0.5, rng.random() < 0.5) for _ in range(100000)]
+
+    def run() -> None:
+        for bool1, bool2 in pairs:
+            boolean_ops.AND(bool1, bool2)
+    return run, len(pairs)
+
+
+def bench_and_bits():
+    """
+    This function prepares a benchmark of boolean_ops.AND_BITS on bytearray bitsets, writing into an existing one.
+    :return: a tuple of a function to be timed and the number of operations (lanes) that it performs.
+    """
+    boolean_ops = load_module("boolean_ops", "Lecture 2 & Bridge 2 - Sample Answers/boolean_ops.py")
+    rng: random.Random = random.Random(9)
+    bits1: bytearray = bytearray(rng.randbytes(100000 // 8))
+    bits2: bytearray = bytearray(rng.randbytes(100000 // 8))
+    out: bytearray = bytearray(len(bits1))
+
+    def run() -> None:
+        boolean_ops.AND_BITS(bits1, bits2, out)
+    return run, 8 * len(bits1)
+
+
+def bisection_script(seek_value: int, upper_value: int) -> list:
+    """
+    This function lists the guesses that halve the range of [0, upper_value] until they find a value.
+    :param seek_value: the integer being sought.
+    :param upper_value: the largest possible value.
+    :return: a list of strings, one per guess.
+    """
+    guesses: list = []
+    low: int = 0
+    high: int = upper_value
+    while True:
+        guess: int = (low + high) // 2
+        guesses.append(str(guess))
+        if guess == seek_value:
+            return guesses
+        if guess > seek_value:
+            high = guess - 1
+        else:
+            low = guess + 1
+
+
+BENCHMARKS: dict = {
+    "mastermind.analyze_combination": bench_analyze_combination,
+    "mastermind.convert_input": bench_convert_input,
+    "mastermind.is_valid_input": bench_is_valid_input,
+    "mastermind.solution_generation": bench_solution_generation,
+    "mastermind.full_game": bench_mastermind_game,
+    "number_guess_game.known_hc": bench_known_hc,
+    "number_guess_game.unknown_hc": bench_unknown_hc,
+    "make_metric.inch_to_cm": bench_inch_to_cm,
+    "make_metric.inches_to_cm": bench_inches_to_cm,
+    "oddity.is_odd": bench_is_odd,
+    "oddity.odd_flags": bench_odd_flags,
+    "boolean_ops.AND": bench_and,
+    "boolean_ops.AND_BITS": bench_and_bits,
+}
+
+
+# The growth in peak bytes per run, and in retained blocks per operation, that is always tolerated.
+MEMORY_SLACK_BYTES: int = 4096
+MEMORY_SLACK_BLOCKS: float = 0.05
+
+
+def measure(benchmark, repeats: int = 5) -> dict:
+    """
+    This function times a benchmark and traces its allocations.
+    The speed is taken from the fastest of several timed runs; allocations come from one further run under tracemalloc.
+    :param benchmark: a function that prepares a benchmark, as in BENCHMARKS.
+    :param repeats: the number of timed runs.
+    :return: a dictionary with the operations per second, the peak memory traced during one run in bytes
+    (above what was held when it started), and the number of memory blocks per operation still held
+    at the end of the run. Blocks that are allocated and freed within the run are not retained,
+    so the last figure shows memory kept or leaked rather than the number of allocations made;
+    short-lived allocations show up in the peak instead.
+    """
+    run, num_operations = benchmark()
+    run()
+    best_time: float = float("inf")
+    for _ in range(repeats):
+        start_time: float = time.perf_counter()
+        run()
+        best_time = min(best_time, time.perf_counter() - start_time)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        run()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retained_blocks: int = sum(max(stat.count_diff, 0) for stat in after.compare_to(before, "lineno"))
+    return {"ops_per_sec": num_operations / best_time,
+            "peak_bytes": peak_bytes - start_bytes,
+            "retained_blocks_per_op": retained_blocks / num_operations}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    This function finds the benchmarks that have slowed down, or use more memory, relative to a baseline.
+    Memory is only compared when it has grown by more than MEMORY_SLACK_BYTES or MEMORY_SLACK_BLOCKS,
+    so that small, noisy figures do not count as regressions.
+    :param results: a dictionary of results from measure, by benchmark name.
+    :param baseline: a dictionary of results from an earlier run, by benchmark name.
+    :param threshold: the fraction of the baseline's speed that may be lost, or of its memory that may be gained,
+    before a regression is reported.
+    :return: a list of strings describing each regression.
+    """
+    regressions: list = []
+    for name, result in results.items():
+        if name in baseline:
+            baseline_speed: float = baseline[name]["ops_per_sec"]
+            if result["ops_per_sec"] < baseline_speed * (1 - threshold):
+                regressions.append(name + ": " + format(result["ops_per_sec"], ".1f") + " ops/sec, down from " +
+                                   format(baseline_speed, ".1f") + " ops/sec.")
+            baseline_peak: int = baseline[name].get("peak_bytes")
+            if baseline_peak is not None and \
+                    result["peak_bytes"] > max(baseline_peak * (1 + threshold), baseline_peak + MEMORY_SLACK_BYTES):
+                regressions.append(name + ": " + str(result["peak_bytes"]) + " peak bytes, up from " +
+                                   str(baseline_peak) + " peak bytes.")
+            baseline_retained: float = baseline[name].get("retained_blocks_per_op")
+            if baseline_retained is not None and result["retained_blocks_per_op"] > \
+                    max(baseline_retained * (1 + threshold), baseline_retained + MEMORY_SLACK_BLOCKS):
+                regressions.append(name + ": " + format(result["retained_blocks_per_op"], ".2f") +
+                                   " retained blocks/op, up from " + format(baseline_retained, ".2f") + ".")
+    return regressions
+
+
+def main() -> int:
+    """
+    This function runs the benchmarks from the command line.
+    :return: an exit status; 1 if any regression was found and 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Pythonic Pursuits sample solutions.")
+    parser.add_argument("--output", default="benchmark_results.json", help="where to write the results")
+    parser.add_argument("--baseline", help="a results file to compare against")
+    parser.add_argument("--save-baseline", help="where to also write the results as a new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="the slowdown that counts as a regression")
+    parser.add_argument("--repeats", type=int, default=5, help="the number of timed runs per benchmark")
+    parser.add_argument("benchmarks", nargs="*", help="the benchmarks to run (all by default)")
+    arguments = parser.parse_args()
+
+    results: dict = {}
+    for name in arguments.benchmarks or BENCHMARKS:
+        results[name] = measure(BENCHMARKS[name], arguments.repeats)
+        print(name + ": " + format(results[name]["ops_per_sec"], ".1f") + " ops/sec, " +
+              format(results[name]["retained_blocks_per_op"], ".2f") + " retained blocks/op, " +
+              str(results[name]["peak_bytes"]) + " peak bytes")
+
+    for path in [arguments.output, arguments.save_baseline]:
+        if path:
+            with open(path, "w") as results_file:
+                json.dump(results, results_file, indent=2)
+
+    if arguments.baseline:
+        with open(arguments.baseline) as baseline_file:
+            regressions: list = compare(results, json.load(baseline_file), arguments.threshold)
+        for regression in regressions:
+            print("Regression: " + regression)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
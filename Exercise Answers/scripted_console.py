@@ -0,0 +1,178 @@
+"""
+This program replays recorded sessions of the console menus in the sample solutions without a terminal.
+The menus (NumberGuessGame.main_menu, Mastermind, and startMenu.start_menu) take a console:
+any object with input and print functions, which is the terminal (the builtins module) by default.
+A ScriptedConsole answers input() from a transcript or any iterator of lines and keeps everything
+printed in an in-memory buffer, so that sessions of thousands of commands can be replayed in milliseconds.
+
+Usage: python scripted_console.py {number_guess,mastermind,start_menu} transcript.txt [--show]
+A transcript is a text file with one line of input per line.
+"""
+
+import argparse
+import importlib.util
+import io
+import os
+import sys
+import time
+
+EXERCISE_DIRECTORY: str = os.path.dirname(os.path.abspath(__file__))
+
+
+class ScriptedConsole:
+    """
+    This class stands in for the terminal. Its input function returns the next scripted line,
+    and its print function writes to a buffer instead of the screen.
+    """
+    def __init__(self, lines, echo: bool = True) -> None:
+        """
+        This method sets up the console.
+        :param lines: an iterable of strings to be returned by input(), in order; trailing newlines are removed.
+        :param echo: a bool as to whether prompts and the lines answering them are written to the buffer,
+        as they would appear on a terminal.
+        """
+        self.lines = iter(lines)
+        self.echo: bool = echo
+        self.buffer: io.StringIO = io.StringIO()
+        self.num_inputs: int = 0
+
+    @classmethod
+    def from_transcript(cls, path: str, echo: bool = True):
+        """
+        This method sets up a console that reads its input from a transcript file, one line at a time.
+        :param path: the path of the transcript.
+        :param echo: a bool as to whether prompts and the lines answering them are written to the buffer.
+        :return: a ScriptedConsole.
+        """
+        with open(path) as transcript:
+            return cls(transcript.read().splitlines(), echo)
+
+    def input(self, prompt: str = "") -> str:
+        """
+        This method returns the next scripted line, like input().
+        Like input() at the end of a file, it raises EOFError when the script runs out.
+        :param prompt: the prompt that would be shown to the user.
+        :return: str
+        """
+        try:
+            line: str = next(self.lines).rstrip("\n")
+        except StopIteration:
+            raise EOFError("The script has run out of input.") from None
+        self.num_inputs += 1
+        if self.echo:
+            self.buffer.write(prompt + line + "\n")
+        return line
+
+    def print(self, *values, sep: str = " ", end: str = "\n") -> None:
+        """
+        This method writes to the buffer, like print().
+        :param values: the objects to be printed.
+        :param sep: the string written between the objects.
+        :param end: the string written after the objects.
+        :return: None.
+        """
+        self.buffer.write(sep.join(map(str, values)) + end)
+
+    @staticmethod
+    def sleep(seconds: float) -> None:
+        """
+        This method stands in for time.sleep() and does not wait at all.
+        :param seconds: the time that would have been waited.
+        :return: None.
+        """
+
+    def output(self) -> str:
+        """
+        This method retrieves everything written so far.
+        :return: str
+        """
+        return self.buffer.getvalue()
+
+
+def load_module(name: str, relative_path: str):
+    """
+    This function imports a sample solution from its file, since the directories holding them are not packages.
+    :param name: the name under which to register the module.
+    :param relative_path: the path of the file, relative to the Exercise Answers directory.
+    :return: the module.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(EXERCISE_DIRECTORY, relative_path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_number_guess(console: ScriptedConsole) -> None:
+    """
+    This function runs the number-guessing game's menu through a console.
+    :param console: a ScriptedConsole.
+    :return: None.
+    """
+    load_module("NumberGuessGame", "Project 1 - Sample Solution/NumberGuessGame.py").main_menu(console)
+
+
+def run_mastermind(console: ScriptedConsole) -> None:
+    """
+    This function runs the Mastermind game through a console, without its pauses and with a fixed seed.
+    :param console: a ScriptedConsole.
+    :return: None.
+    """
+    load_module("mastermind", "Project 2 - Sample Solution/mastermind.py").Mastermind(
+        seed=0, console=console, pause=console.sleep)
+
+
+def run_start_menu(console: ScriptedConsole) -> None:
+    """
+    This function runs the start menu exercise through a console.
+    :param console: a ScriptedConsole.
+    :return: None.
+    """
+    load_module("startMenu", "Lecture 2 & Bridge 2 - Sample Answers/startMenu.py").start_menu(console)
+
+
+SESSIONS: dict = {
+    "number_guess": run_number_guess,
+    "mastermind": run_mastermind,
+    "start_menu": run_start_menu,
+}
+
+
+def replay(session, lines, echo: bool = True) -> ScriptedConsole:
+    """
+    This function replays a session of one of the menus.
+    :param session: a function that runs a menu through a console, as in SESSIONS.
+    :param lines: an iterable of strings to be returned by input(), in order.
+    :param echo: a bool as to whether prompts and the lines answering them are written to the buffer.
+    :return: the ScriptedConsole, holding the session's output.
+    """
+    console: ScriptedConsole = ScriptedConsole(lines, echo)
+    session(console)
+    return console
+
+
+def main() -> None:
+    """
+    This function replays a transcript from the command line and reports how long it took.
+    :return: None.
+    """
+    parser = argparse.ArgumentParser(description="Replay a transcript through one of the console menus.")
+    parser.add_argument("session", choices=sorted(SESSIONS))
+    parser.add_argument("transcript", help="a text file with one line of input per line")
+    parser.add_argument("--show", action="store_true", help="print the session's output")
+    arguments = parser.parse_args()
+
+    with open(arguments.transcript) as transcript:
+        lines: list = transcript.read().splitlines()
+    start_time: float = time.perf_counter()
+    console: ScriptedConsole = replay(SESSIONS[arguments.session], lines)
+    elapsed_time: float = time.perf_counter() - start_time
+    if arguments.show:
+        sys.stdout.write(console.output())
+    print("Replayed " + str(console.num_inputs) + " inputs in " + format(elapsed_time * 1000, ".1f") + " ms.")
+
+
+if __name__ == "__main__":
+    main()